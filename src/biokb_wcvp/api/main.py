@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 from typing import Annotated, Dict, Optional, Sequence
 
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
@@ -26,6 +26,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# TDWG reference data only changes with a new import, clients and proxies may
+# cache it for an hour
+REFERENCE_DATA_CACHE_CONTROL = "public, max-age=3600"
+
 USERNAME = os.environ.get("WCVP_API_USERNAME", "admin")
 PASSWORD = os.environ.get("WCVP_API_PASSWORD", "admin")
 
@@ -69,6 +73,11 @@ def run_api(host: str = "0.0.0.0", port: int = 8000):
     )
 
 
+def cache_reference_data(response: Response) -> None:
+    """Allow HTTP caching of responses with TDWG reference data."""
+    response.headers["Cache-Control"] = REFERENCE_DATA_CACHE_CONTROL
+
+
 def verify_credentials(credentials: HTTPBasicCredentials = Depends(HTTPBasic())):
     is_correct_username = secrets.compare_digest(credentials.username, USERNAME)
     is_correct_password = secrets.compare_digest(credentials.password, PASSWORD)
@@ -94,14 +103,15 @@ def import_data(
 
 
 @app.get(path="/download_ttls/", tags=[Tag.DBMANAGE])
-async def export_ttls(
+def export_ttls(
     credentials: HTTPBasicCredentials = Depends(verify_credentials),
 ) -> FileResponse:
     """Create zipped RDF turtle files (if not exists) for WCVP data export."""
     dbm = manager.DbManager()
     if not os.path.exists(ZIPPED_TTLS_PATH):
         tc = TurtleCreator(dbm._engine)
-        tc.create_ttls()
+        # no worker processes forked from the request threadpool
+        tc.create_ttls(parallel=False)
 
     return FileResponse(
         path=ZIPPED_TTLS_PATH, filename="wcvp_ttls.zip", media_type="application/zip"
@@ -109,7 +119,7 @@ async def export_ttls(
 
 
 @app.get(path="/import_into_neo4j/", tags=[Tag.DBMANAGE])
-async def import_into_neo4j(
+def import_into_neo4j(
     credentials: HTTPBasicCredentials = Depends(verify_credentials),
 ):
     """Create zipped RDF turtle files (if not exists) for WCVP data export."""
@@ -128,10 +138,11 @@ async def import_into_neo4j(
 
     if not os.path.exists(ZIPPED_TTLS_PATH):
         tc = TurtleCreator(dbm._engine)
-        tc.create_ttls()
+        # no worker processes forked from the request threadpool
+        tc.create_ttls(parallel=False)
 
-    ni = Neo4jImporter()
-    ni.import_ttls(delete_existing_graph=True)
+    with Neo4jImporter() as ni:
+        ni.import_ttls(delete_existing_graph=True)
 
     return True
 
@@ -141,7 +152,7 @@ async def import_into_neo4j(
     response_model=schemas.PlantSearchResults,
     tags=[Tag.PLANT],
 )
-async def search_plants(
+def search_plants(
     search: schemas.PlantSearch = Depends(),
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 10,
@@ -164,7 +175,7 @@ async def search_plants(
     response_model=schemas.PlantSearchResultsWithLocs,
     tags=[Tag.PLANT],
 )
-async def search_plants_with_locations(
+def search_plants_with_locations(
     search: schemas.PlantSearch = Depends(),
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 10,
@@ -179,13 +190,14 @@ async def search_plants_with_locations(
         db=session,
         limit=limit,
         offset=offset,
+        with_locations=True,
     )
 
 
 @app.get(
     "/locations/", response_model=schemas.LocationSearchResults, tags=[Tag.LOCATION]
 )
-async def search_locations(
+def search_locations(
     search: schemas.LocationSearch = Depends(),
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 10,
@@ -207,8 +219,9 @@ async def search_locations(
     "/locations/continent/",
     response_model=list[schemas.Continent],
     tags=[Tag.LOCATION],
+    dependencies=[Depends(cache_reference_data)],
 )
-async def search_continents(
+def search_continents(
     code_l1: Optional[int] = None,
     name: Optional[str] = None,
     session: Session = Depends(get_session),
@@ -226,8 +239,9 @@ async def search_continents(
     "/locations/region/",
     response_model=list[schemas.Region],
     tags=[Tag.LOCATION],
+    dependencies=[Depends(cache_reference_data)],
 )
-async def search_regions(
+def search_regions(
     code_l2: Optional[int] = None,
     name: Optional[str] = None,
     session: Session = Depends(get_session),
@@ -245,8 +259,9 @@ async def search_regions(
     "/locations/area/",
     response_model=list[schemas.Area],
     tags=[Tag.LOCATION],
+    dependencies=[Depends(cache_reference_data)],
 )
-async def search_areas(
+def search_areas(
     code_l3: Optional[str] = None,
     name: Optional[str] = None,
     session: Session = Depends(get_session),
@@ -265,7 +280,7 @@ async def search_areas(
     response_model=list[str],
     tags=[Tag.LOCATION],
 )
-async def get_areas_by_tax_id(
+def get_areas_by_tax_id(
     tax_id: int,
     session: Session = Depends(get_session),
 ) -> Sequence[str | None]:
@@ -286,7 +301,7 @@ async def get_areas_by_tax_id(
     response_model=list[str],
     tags=[Tag.LOCATION],
 )
-async def get_areas_by_tax_ids(
+def get_areas_by_tax_ids(
     tax_ids: list[int] = Query(),
     session: Session = Depends(get_session),
 ) -> Sequence[str | None]:
@@ -307,7 +322,7 @@ async def get_areas_by_tax_ids(
     response_model=list[str],
     tags=[Tag.LOCATION],
 )
-async def get_areas_by_plant_name_ids(
+def get_areas_by_plant_name_ids(
     plant_name_ids: list[int] = Query(),
     session: Session = Depends(get_session),
 ) -> Sequence[str | None]:
@@ -328,7 +343,7 @@ async def get_areas_by_plant_name_ids(
     response_model=schemas.PlantLocationSearchResults,
     tags=[Tag.LOCATION, Tag.PLANT],
 )
-async def search_plant_location(
+def search_plant_location(
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 10,
     plant_name_id: Optional[int] = None,
@@ -433,7 +448,7 @@ async def search_plant_location(
     response_model=list[schemas.CountryLocation],
     tags=[Tag.LOCATION, Tag.PLANT],
 )
-async def plant_locations_statistics(
+def plant_locations_statistics(
     plant_name_id: Optional[int] = None,
     ipni_id: Optional[str] = None,
     taxon_name: Optional[str] = None,
@@ -5,7 +5,7 @@ from typing import Optional, Union, get_args, get_origin
 
 from pydantic import BaseModel
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +20,7 @@ def build_dynamic_query(
     db: Session,
     limit: Optional[int] = None,  # default limit for pagination
     offset: Optional[int] = None,  # default offset for pagination
+    with_locations: bool = False,  # eager load the locations of plants
 ):
     try:
         return _build_dynamic_query(
@@ -28,6 +29,7 @@ def build_dynamic_query(
             db=db,
             limit=limit,
             offset=offset,
+            with_locations=with_locations,
         )
     except Exception as e:
         logger.error(f"Error in node search: {e}")
@@ -40,6 +42,7 @@ def _build_dynamic_query(
     db: Session,
     limit: Optional[int] = None,  # default limit for pagination
     offset: Optional[int] = None,  # default offset for pagination
+    with_locations: bool = False,  # eager load the locations of plants
 ):
     """
     Build and execute a SQLAlchemy 2.0-style SELECT based on the non-None
@@ -47,6 +50,9 @@ def _build_dynamic_query(
     each field's *declared* type, not the runtime value.
 
     Handles both direct model fields and relationship fields (e.g., family, genus, taxon_rank).
+
+    Relationships read by the response schemas are loaded eagerly, so that
+    serializing the results does not issue one query per row.
     """
     from biokb_wcvp.db import models
 
@@ -133,7 +139,7 @@ def _build_dynamic_query(
 
         # STRING ......................................................................
         if origin is str:
-            logger.info(f"Used string filter for {field_name}")
+            logger.debug(f"Used string filter for {field_name}")
             filters.append(column.like(value) if ("%" in value) else column == value)
 
         # NUMBERS .....................................................................
@@ -162,8 +168,42 @@ def _build_dynamic_query(
             )
             filters.append(column == value)
 
+    # lookup relationships whose names are part of the response schemas,
+    # all many-to-one, so they are joined into the main query
+    plant_lookups = [
+        joinedload(getattr(models.Plant, name))
+        for name in (
+            "taxon_rank",
+            "taxon_status",
+            "family",
+            "genus",
+            "infraspecific_rank",
+            "lifeform_description",
+            "climate_description",
+        )
+    ]
+    location_lookups = [
+        joinedload(models.Location.continent),
+        joinedload(models.Location.region),
+        joinedload(models.Location.area),
+    ]
+
     # Build the SELECT statement with joins if needed
     stmt = select(model_cls)
+    # response schemas include the deferred free text columns of Plant
+    if model_cls == models.Plant:
+        stmt = stmt.options(undefer_group(models.FREE_TEXT_GROUP), *plant_lookups)
+        if with_locations:
+            stmt = stmt.options(
+                selectinload(models.Plant.locations).options(*location_lookups)
+            )
+    elif model_cls == models.Location:
+        stmt = stmt.options(
+            *location_lookups,
+            selectinload(models.Location.plant)
+            .undefer_group(models.FREE_TEXT_GROUP)
+            .options(*plant_lookups),
+        )
     for join_model in joins:
         stmt = stmt.outerjoin(join_model)
     stmt = stmt.where(*filters)
@@ -181,7 +221,10 @@ def _build_dynamic_query(
     if offset is not None:
         stmt = stmt.offset(offset)
 
-    logger.info(stmt.compile(compile_kwargs={"literal_binds": True}))
+    # compiling with literal binds bypasses the compiled statement cache, so the
+    # SQL is only rendered when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(stmt.compile(compile_kwargs={"literal_binds": True}))
 
     return {
         "count": total_count,
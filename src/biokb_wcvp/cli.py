@@ -177,7 +177,8 @@ def import_neo4j(uri: str, user: str, password: Optional[str]) -> None:
         click.echo(
             "It is not recommended to provide the Neo4j password via command line."
         )
-    Neo4jImporter(neo4j_uri=uri, neo4j_user=user, neo4j_pwd=password).import_ttls()
+    with Neo4jImporter(neo4j_uri=uri, neo4j_user=user, neo4j_pwd=password) as importer:
+        importer.import_ttls()
 
 
 @main.command("run-server")
@@ -1,15 +1,28 @@
+import csv
 import io
 import logging
 import os
 import shutil
 import sqlite3
 import zipfile
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Optional, Type, Union
+from typing import Any, Iterable, Iterator, Optional, Type, Union
 
 import pandas as pd
 import requests
-from sqlalchemy import Engine, create_engine, event, insert, select, text, update
+from pandas.io.sql import SQLTable
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Index,
+    create_engine,
+    event,
+    insert,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 
@@ -32,15 +45,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# rows per INSERT statement when SQLAlchemy batches executemany() calls
+# ("insertmanyvalues"). PostgreSQL allows at most 65535 bind parameters per
+# statement: 2000 rows of the widest table (32 columns) stay below it. MySQL and
+# MariaDB drivers inline the parameters, so only max_allowed_packet (64 MiB by
+# default) applies; 10000 plant rows are a few MiB.
+INSERTMANYVALUES_PAGE_SIZES: dict[str, int] = {
+    "postgresql": 2_000,
+    "mysql": 10_000,
+    "mariadb": 10_000,
+}
+
+
+# PRAGMAs set on each new SQLite connection of a manager's engine: temporary
+# tables in memory, 64 MiB page cache, 256 MiB mmap
+SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# PRAGMAs set on connections used while importing: fsync only at checkpoints of
+# the write-ahead log, which is enabled for the duration of the import
+SQLITE_IMPORT_PRAGMAS: tuple[str, ...] = ("PRAGMA synchronous=NORMAL",)
+
+
+def _execute_pragmas(dbapi_connection: object, pragmas: tuple[str, ...]) -> None:
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
 
-@event.listens_for(Engine, "connect")
 def set_sqlite_pragma(
     dbapi_connection: sqlite3.Connection, _connection_record: object
 ) -> None:
-    """Enable foreign key constraint for SQLite."""
-    if isinstance(dbapi_connection, sqlite3.Connection):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
+    """Enable foreign key constraint and a larger cache for SQLite."""
+    _execute_pragmas(dbapi_connection, SQLITE_PRAGMAS)
+
+
+def set_sqlite_import_pragma(
+    dbapi_connection: sqlite3.Connection, *_args: object
+) -> None:
+    """Trade durability of the last transactions for faster bulk writes."""
+    _execute_pragmas(dbapi_connection, SQLITE_IMPORT_PRAGMAS)
+
+
+def _rows_to_csv(data_iter: Iterable[tuple[Any, ...]]) -> io.StringIO:
+    """Write rows as CSV for `COPY ... FROM STDIN WITH (FORMAT CSV)`.
+
+    pandas hands over nullable integer columns (foreign keys added by a left merge,
+    parent/accepted ids, location codes) as floats; integral floats are written as
+    integers because PostgreSQL rejects "5.0" for integer columns.
+
+    Args:
+        data_iter (Iterable): rows to write.
+
+    Returns:
+        io.StringIO: CSV buffer positioned at the start.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in data_iter:
+        writer.writerow(
+            [
+                int(value) if isinstance(value, float) and value.is_integer() else value
+                for value in row
+            ]
+        )
+    buffer.seek(0)
+    return buffer
+
+
+def postgres_copy(
+    table: SQLTable,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """pandas `to_sql` insertion method using PostgreSQL `COPY ... FROM STDIN`.
+
+    Skips SQL parsing of every row, which makes it several times faster than
+    batched INSERT statements for the large WCVP tables.
+
+    Args:
+        table (pandas.io.sql.SQLTable): pandas table wrapper.
+        conn (sqlalchemy.engine.Connection): connection used by pandas.
+        keys (list[str]): column names.
+        data_iter (Iterable): rows to insert.
+
+    Returns:
+        int: number of inserted rows.
+    """
+    buffer = _rows_to_csv(data_iter)
+    columns = ", ".join(f'"{k}"' for k in keys)
+    table_name = (
+        f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    )
+    sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)"
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            cursor.copy_expert(sql=sql, file=buffer)
+        else:  # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        return int(cursor.rowcount)
+    finally:
         cursor.close()
 
 
@@ -57,12 +170,22 @@ class Manager:
         """
         connection_str: str = os.getenv("CONNECTION_STR", DB_DEFAULT_CONNECTION_STR)
 
-        self._engine = engine if engine else create_engine(connection_str)
+        # only an engine created here is disposed by the manager
+        self._owns_engine = engine is None
+        engine = engine if engine else create_engine(connection_str)
+        page_size = INSERTMANYVALUES_PAGE_SIZES.get(engine.dialect.name)
+        if page_size:
+            engine = engine.execution_options(insertmanyvalues_page_size=page_size)
+        self._engine = engine
         if self._engine.dialect.name == "sqlite":
+            if not event.contains(self._engine, "connect", set_sqlite_pragma):
+                event.listen(self._engine, "connect", set_sqlite_pragma)
             with self._engine.connect() as connection:
                 connection.execute(text("pragma foreign_keys=ON"))
 
-        self.Session = sessionmaker(bind=self._engine)
+        # objects loaded by API sessions stay readable after a commit without
+        # being reloaded from the database
+        self.Session = sessionmaker(bind=self._engine, expire_on_commit=False)
         logger.info("Engine: %s", self._engine)
 
 
@@ -83,6 +206,10 @@ class DbManager(Manager):
         """
         super().__init__(engine)
         self.path_data_folder = DEFAULT_PATH_UNZIPPED_DATA_FOLDER
+        # bulk load path for the large tables, None falls back to batched INSERTs
+        self._bulk_insert_method = (
+            postgres_copy if self._engine.dialect.name == "postgresql" else None
+        )
 
     @property
     def session(self) -> Session:
@@ -101,26 +228,96 @@ class DbManager(Manager):
         models.Base.metadata.drop_all(bind=self._engine)
         models.Base.metadata.create_all(bind=self._engine)
 
+    def drop_bulk_indexes(self) -> list[Index]:
+        """Drop the secondary indexes of the plant and location tables.
+
+        Only done on SQLite and PostgreSQL. MySQL uses the indexes on foreign key
+        columns to back the FOREIGN KEY constraints and refuses to drop them.
+
+        Returns:
+            list[Index]: dropped indexes, to be passed to `create_indexes`.
+        """
+        if self._engine.dialect.name not in ("sqlite", "postgresql"):
+            return []
+        indexes = [
+            index
+            for model in (models.Plant, models.Location)
+            for index in model.__table__.indexes  # type: ignore
+        ]
+        for index in indexes:
+            index.drop(bind=self._engine)
+        return indexes
+
+    def create_indexes(self, indexes: list[Index]) -> None:
+        """Create indexes and refresh the query planner statistics."""
+        logger.info("Creating indexes")
+        for index in indexes:
+            index.create(bind=self._engine)
+        if self._engine.dialect.name in ("sqlite", "postgresql"):
+            with self._engine.begin() as connection:
+                connection.execute(text("ANALYZE"))
+
+    @contextmanager
+    def sqlite_import_mode(self) -> Iterator[None]:
+        """Use the write-ahead log with fsync only at checkpoints while importing.
+
+        Only applies to file based SQLite databases and to an engine the manager
+        created itself. The database is switched back to the default rollback
+        journal afterwards, so the setting does not stay in the database file.
+        Leaving WAL mode needs the only open connection, which is why the pool is
+        disposed; an engine passed in by the caller is left untouched.
+        """
+        database = self._engine.url.database
+        if (
+            not self._owns_engine
+            or self._engine.dialect.name != "sqlite"
+            or database in (None, "", ":memory:")
+        ):
+            yield
+            return
+        event.listen(self._engine, "checkout", set_sqlite_import_pragma)
+        try:
+            with self._engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+            yield
+        finally:
+            event.remove(self._engine, "checkout", set_sqlite_import_pragma)
+            # leaving WAL mode requires the only open connection to the database
+            self._engine.dispose()
+            with self._engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA journal_mode=DELETE")
+
     def import_data(self, force_download: bool = False, delete_files: bool = False):
+        with self.sqlite_import_mode():
+            imported = self._import_data(force_download)
+
+        if delete_files:
+            if os.path.exists(DEFAULT_PATH_UNZIPPED_DATA_FOLDER):
+                shutil.rmtree(DEFAULT_PATH_UNZIPPED_DATA_FOLDER)
+            if delete_files and os.path.exists(PATH_TO_ZIP_FILE):
+                os.remove(PATH_TO_ZIP_FILE)
+
+        return imported
+
+    def _import_data(self, force_download: bool) -> dict[str, int]:
         self.recreate_db()
         download_and_unzip(force_download)
 
+        # indexes are built once after the bulk load instead of being updated
+        # for every inserted row
+        indexes = self.drop_bulk_indexes()
         imported: dict[str, int] = {}
-        imported.update(self.import_plants())
-        logger.info("Plants imported successfully.")
-        imported.update(self.import_locations())
-        logger.info("Locations imported successfully.")
+        try:
+            imported.update(self.import_plants())
+            logger.info("Plants imported successfully.")
+            imported.update(self.import_locations())
+            logger.info("Locations imported successfully.")
+        finally:
+            self.create_indexes(indexes)
         self.update_plant_tax_ids()
         logger.info("Tax IDs updated successfully.")
         imported.update(self.import_wgsrpd())
         logger.info("WGS-RPD data imported successfully.")
-
-        if delete_files:
-            if os.path.exists(DEFAULT_PATH_UNZIPPED_DATA_FOLDER):
-                shutil.rmtree(DEFAULT_PATH_UNZIPPED_DATA_FOLDER)
-            if delete_files and os.path.exists(PATH_TO_ZIP_FILE):
-                os.remove(PATH_TO_ZIP_FILE)
-
         return imported
 
     def extract_and_insert(
@@ -208,6 +405,7 @@ class DbManager(Manager):
             con=self._engine,
             if_exists="append",
             chunksize=10000,
+            method=self._bulk_insert_method,
         )
 
         # df_tree, root_id = Tree(
@@ -322,6 +520,7 @@ class DbManager(Manager):
             if_exists="append",
             index=False,
             chunksize=100_000,
+            method=self._bulk_insert_method,
         )
         return {
             models.Area.__tablename__: inserted_area or 0,
@@ -369,6 +568,7 @@ class DbManager(Manager):
             self._engine,
             if_exists="append",
             chunksize=10000,
+            method=self._bulk_insert_method,
         )
 
     def update_plant_tax_ids(self, import_taxonomy_names: bool = True):
@@ -3,8 +3,9 @@
 import enum
 from typing import Optional
 
+from sqlalchemy import CHAR
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy import ForeignKey, Index, SmallInteger, String, Text, false, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from biokb_wcvp.constants import PROJECT_NAME
@@ -12,6 +13,9 @@ from biokb_wcvp.rdf.namespaces import AREA_NS
 
 table_prefix = PROJECT_NAME + "_"
 
+# deferred free text columns of Plant, load them with undefer_group(FREE_TEXT_GROUP)
+FREE_TEXT_GROUP = "free_text"
+
 
 # TODO: add validate_strings=True to SAEnum when dropping support for SQLite
 class Hybrid(enum.Enum):
@@ -51,39 +55,35 @@ class TaxonRank(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
-        String(255), comment="Taxonomic rank of the taxon"
+        String(255), index=True, comment="Taxonomic rank of the taxon"
     )
 
-    plants: Mapped[list["Plant"]] = relationship(back_populates="taxon_rank")
-
 
 class TaxonStatus(Base):
     __tablename__ = table_prefix + "taxon_status"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
-        String(255), comment="Nomenclatural status of the taxon"
+        String(255), index=True, comment="Nomenclatural status of the taxon"
     )
 
-    plants: Mapped[list["Plant"]] = relationship(back_populates="taxon_status")
-
 
 class Family(Base):
     __tablename__ = table_prefix + "family"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(255), comment="Family name of the taxon")
-
-    plants: Mapped[list["Plant"]] = relationship(back_populates="family")
+    name: Mapped[str] = mapped_column(
+        String(255), index=True, comment="Family name of the taxon"
+    )
 
 
 class Genus(Base):
     __tablename__ = table_prefix + "genus"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(255), comment="Genus name of the taxon")
-
-    plants: Mapped[list["Plant"]] = relationship(back_populates="genus")
+    name: Mapped[str] = mapped_column(
+        String(255), index=True, comment="Genus name of the taxon"
+    )
 
 
 class InfraspecificRank(Base):
@@ -91,22 +91,18 @@ class InfraspecificRank(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
-        String(255), comment="Infraspecific rank of the taxon"
+        String(255), index=True, comment="Infraspecific rank of the taxon"
     )
 
-    plants: Mapped[list["Plant"]] = relationship(back_populates="infraspecific_rank")
-
 
 class LifeformDescription(Base):
     __tablename__ = table_prefix + "lifeform_description"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
-        String(255), comment="Lifeform description of the taxon"
+        String(255), index=True, comment="Lifeform description of the taxon"
     )
 
-    plants: Mapped[list["Plant"]] = relationship(back_populates="lifeform_description")
-
 
 class ClimateDescription(Base):
     __tablename__ = table_prefix + "climate_description"
@@ -114,11 +110,10 @@ class ClimateDescription(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
         String(255),
+        index=True,
         comment="Habitat type of the taxon, derived from published habitat information.",
     )
 
-    plants: Mapped[list["Plant"]] = relationship(back_populates="climate_description")
-
 
 # plant_name_id|ipni_id|taxon_rank|taxon_status|family|genus_hybrid|genus|species_hybrid|species|infraspecific_rank|infraspecies|parenthetical_author|primary_author|publication_author|place_of_publication|volume_and_page|first_published|nomenclatural_remarks|geographic_area|lifeform_description|climate_description|taxon_name|taxon_authors|accepted_plant_name_id|basionym_plant_name_id|replaced_synonym_author|homotypic_synonym|parent_plant_name_id|powo_id|hybrid_formula|reviewed
 class Plant(Base):
@@ -132,6 +127,7 @@ class Plant(Base):
     )
     ipni_id: Mapped[Optional[str]] = mapped_column(
         String(255),
+        index=True,
         comment="International Plant Name Index (IPNI) identifier. Missing values indicate that the name has not been matched with a name in IPNI or is missing from IPNI.",
     )
     species: Mapped[Optional[str]] = mapped_column(
@@ -164,10 +160,14 @@ class Plant(Base):
     )
     place_of_publication: Mapped[Optional[str]] = mapped_column(
         String(255),
+        deferred=True,
+        deferred_group=FREE_TEXT_GROUP,
         comment="The journal, book or other publication in which the taxon name was effectively published.",
     )
     volume_and_page: Mapped[Optional[str]] = mapped_column(
         String(255),
+        deferred=True,
+        deferred_group=FREE_TEXT_GROUP,
         comment="The volume and page numbers of the original publication of the taxon name, where '5(6): 36' is volume 5, issue 6, page 36.",
     )
     first_published: Mapped[Optional[str]] = mapped_column(
@@ -176,10 +176,14 @@ class Plant(Base):
     )
     nomenclatural_remarks: Mapped[Optional[str]] = mapped_column(
         String(255),
+        deferred=True,
+        deferred_group=FREE_TEXT_GROUP,
         comment="Remarks on the nomenclature. Preceded by a comma and space (', ') for easy concatenation.",
     )
     geographic_area: Mapped[Optional[str]] = mapped_column(
         String(255),
+        deferred=True,
+        deferred_group=FREE_TEXT_GROUP,
         comment="The geographic distribution of the taxon (for names of species rank or below): a generalised statement in narrative form.",
     )
     taxon_name: Mapped[str] = mapped_column(
@@ -207,6 +211,7 @@ class Plant(Base):
     )
     powo_id: Mapped[Optional[str]] = mapped_column(
         String(255),
+        index=True,
         comment="Identifier required to look up the name directly in Plants of the World Online (Powo). It is only optional for root if not exists before.",
     )
     hybrid_formula: Mapped[Optional[str]] = mapped_column(
@@ -229,9 +234,11 @@ class Plant(Base):
     )
     family_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey(table_prefix + "family.id"),
+        index=True,
     )
     genus_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey(table_prefix + "genus.id"),
+        index=True,
     )
     infraspecific_rank_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey(table_prefix + "infraspecific_rank.id"),
@@ -248,21 +255,13 @@ class Plant(Base):
     locations: Mapped[list["Location"]] = relationship(
         back_populates="plant",
     )
-    taxon_rank: Mapped[Optional["TaxonRank"]] = relationship(back_populates="plants")
-    taxon_status: Mapped[Optional["TaxonStatus"]] = relationship(
-        back_populates="plants"
-    )
-    family: Mapped[Optional["Family"]] = relationship(back_populates="plants")
-    genus: Mapped[Optional["Genus"]] = relationship(back_populates="plants")
-    infraspecific_rank: Mapped[Optional["InfraspecificRank"]] = relationship(
-        back_populates="plants"
-    )
-    lifeform_description: Mapped[Optional["LifeformDescription"]] = relationship(
-        back_populates="plants"
-    )
-    climate_description: Mapped[Optional["ClimateDescription"]] = relationship(
-        back_populates="plants"
-    )
+    taxon_rank: Mapped[Optional["TaxonRank"]] = relationship()
+    taxon_status: Mapped[Optional["TaxonStatus"]] = relationship()
+    family: Mapped[Optional["Family"]] = relationship()
+    genus: Mapped[Optional["Genus"]] = relationship()
+    infraspecific_rank: Mapped[Optional["InfraspecificRank"]] = relationship()
+    lifeform_description: Mapped[Optional["LifeformDescription"]] = relationship()
+    climate_description: Mapped[Optional["ClimateDescription"]] = relationship()
     tree: Mapped[Optional["Tree"]] = relationship(back_populates="plant")
 
     def __repr__(self) -> str:
@@ -288,74 +287,99 @@ class Continent(Base):
     __tablename__ = table_prefix + "continent"
 
     code_l1: Mapped[int] = mapped_column(
-        primary_key=True, comment="Botanical continent code (TDWG Level 1)"
+        SmallInteger,
+        primary_key=True,
+        comment="Botanical continent code (TDWG Level 1)",
     )
     name: Mapped[str] = mapped_column(
         String(255), comment="Botanical continent (TDWG Level 1)"
     )
 
-    locations: Mapped[list["Location"]] = relationship(
-        back_populates="continent",
-    )
-
 
 class Region(Base):
     __tablename__ = table_prefix + "region"
 
     code_l2: Mapped[int] = mapped_column(
-        primary_key=True, comment="Botanical region code (TDWG Level 2)"
+        SmallInteger,
+        primary_key=True,
+        comment="Botanical region code (TDWG Level 2)",
     )
     name: Mapped[str] = mapped_column(
         String(255), comment="Botanical region (TDWG Level 2)"
     )
 
-    locations: Mapped[list["Location"]] = relationship(
-        back_populates="region",
-    )
-
 
 class Area(Base):
     __tablename__ = table_prefix + "area"
 
     code_l3: Mapped[str] = mapped_column(
-        String(3),
+        CHAR(3),
         primary_key=True,
         comment="Three letter botanical area code (TDWG Level 3)",
     )
     name: Mapped[str] = mapped_column(
         String(255), comment="Botanical area (TDWG Level 3)"
     )
-    locations: Mapped[list["Location"]] = relationship(
-        back_populates="area",
-    )
 
 
 class Location(Base):
     __tablename__ = table_prefix + "location"
+    __table_args__ = (
+        # partial index for "where has the plant been introduced" queries
+        Index(
+            "ix_location__introduced",
+            "wcvp_plant_id",
+            sqlite_where=text("introduced = 1"),
+            postgresql_where=text("introduced"),
+        ),
+        # partial index for "where is the plant locally extinct" queries
+        Index(
+            "ix_location__extinct",
+            "wcvp_plant_id",
+            sqlite_where=text("extinct = 1"),
+            postgresql_where=text("extinct"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    introduced: Mapped[bool] = mapped_column(comment="Introduced status of the taxon")
+    introduced: Mapped[bool] = mapped_column(
+        default=False,
+        server_default=false(),
+        comment="Introduced status of the taxon",
+    )
     extinct: Mapped[bool] = mapped_column(
-        comment="Local extinction status of the taxon"
+        default=False,
+        server_default=false(),
+        comment="Local extinction status of the taxon",
+    )
+    location_doubtful: Mapped[bool] = mapped_column(
+        default=False,
+        server_default=false(),
+        comment="Doubtful status of taxon",
     )
-    location_doubtful: Mapped[bool] = mapped_column(comment="Doubtful status of taxon")
 
     # foreign keys
     wcvp_plant_id: Mapped[int] = mapped_column(
         ForeignKey("wcvp_plant.plant_name_id"),
+        index=True,
         comment="WCVP identifier",
     )
     code_l1: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
         ForeignKey(table_prefix + "continent.code_l1"),
+        index=True,
         comment="continental geographical location level 1 code",
     )
     code_l2: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
         ForeignKey(table_prefix + "region.code_l2"),
+        index=True,
         comment="regional geographical location level 2 code",
     )
     code_l3: Mapped[Optional[str]] = mapped_column(
-        String(3),
+        CHAR(3),
         ForeignKey(table_prefix + "area.code_l3"),
+        index=True,
         comment="area geographical location level 3 code",
     )
 
@@ -363,15 +387,9 @@ class Location(Base):
     plant: Mapped["Plant"] = relationship(
         back_populates="locations",
     )
-    continent: Mapped[Optional["Continent"]] = relationship(
-        back_populates="locations",
-    )
-    region: Mapped[Optional["Region"]] = relationship(
-        back_populates="locations",
-    )
-    area: Mapped[Optional["Area"]] = relationship(
-        back_populates="locations",
-    )
+    continent: Mapped[Optional["Continent"]] = relationship()
+    region: Mapped[Optional["Region"]] = relationship()
+    area: Mapped[Optional["Area"]] = relationship()
 
 
 class TaxonomyNameTypes(enum.Enum):
@@ -1,8 +1,7 @@
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
+import numpy as np
 import pandas as pd
 
 """Tree structure builder for hierarchical data.
@@ -13,7 +12,8 @@ tree representation with additional metadata such as tree IDs, levels, and
 right tree IDs for efficient tree traversal.
 
 Classes:
-    TreeEntry: A dataclass representing a single node in the tree structure.
+    ParentChilds: Parent-child relationships in CSR layout.
+    TreeArrays: Column arrays holding one entry per tree node.
     Tree: Main class for building and managing tree structures from DataFrames.
 
 Example:
@@ -28,15 +28,104 @@ Example:
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass(slots=True)
-class TreeEntry:
-    tree_id: int
-    tree_parent_id: Optional[int]
-    db_id: int  # original ID from the database
-    level: int
-    right_tree_id: Optional[int] = None
-    is_leaf: Optional[bool] = False
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the kernel then runs as plain Python
+    njit = None  # type: ignore[assignment]
+
+
+class ParentChilds(NamedTuple):
+    """Parent-child relationships over dense rows, the children of row ``i`` are
+    ``children[offsets[i]:offsets[i + 1]]``."""
+
+    db_ids: np.ndarray  # db_id per row
+    offsets: np.ndarray
+    children: np.ndarray  # child rows grouped by parent row
+
+
+class TreeArrays(NamedTuple):
+    """Tree nodes as column arrays, index ``i`` holds the node with tree ID
+    ``i + 1``."""
+
+    tree_parent_id: np.ndarray  # 0 for the root
+    db_id: np.ndarray  # original ID from the database
+    level: np.ndarray
+    is_leaf: np.ndarray
+    exit_tree_id: np.ndarray  # last tree ID within the node's subtree
+
+
+def _build_tree_arrays(
+    offsets: np.ndarray, children: np.ndarray, root_row: int, n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Traverses the hierarchy depth-first (pre-order) with an explicit stack.
+
+    Nodes are dense row indices; the children of row ``i`` are
+    ``children[offsets[i]:offsets[i + 1]]`` (CSR layout).
+
+    Args:
+        offsets (np.ndarray): Start offsets into `children` per row, length rows + 1.
+        children (np.ndarray): Child rows grouped by parent row.
+        root_row (int): Row of the root node.
+        n (int): Number of tree nodes to emit.
+
+    Returns:
+        tuple[np.ndarray, ...]: tree_parent_id (0 for the root), row, level,
+            is_leaf and exit_tree_id per tree node, ordered by tree ID.
+    """
+    tree_parent_ids = np.empty(n, dtype=np.int64)
+    rows = np.empty(n, dtype=np.int64)
+    levels = np.empty(n, dtype=np.int64)
+    is_leaf = np.empty(n, dtype=np.bool_)
+    exit_tree_ids = np.empty(n, dtype=np.int64)
+    # stack of (row, tree_parent_id, level); level -1 marks the end of the
+    # subtree of the node with tree ID tree_parent_id
+    stack_rows = np.empty(2 * n, dtype=np.int64)
+    stack_tree_parent_ids = np.empty(2 * n, dtype=np.int64)
+    stack_levels = np.empty(2 * n, dtype=np.int64)
+    stack_rows[0] = root_row
+    stack_tree_parent_ids[0] = 0
+    stack_levels[0] = 0
+    top = 1
+    next_tree_id = 0
+    while top > 0:
+        top -= 1
+        row = stack_rows[top]
+        tree_parent_id = stack_tree_parent_ids[top]
+        level = stack_levels[top]
+        if level == -1:
+            exit_tree_ids[tree_parent_id - 1] = next_tree_id
+            continue
+        i = next_tree_id
+        next_tree_id += 1
+        start = offsets[row]
+        end = offsets[row + 1]
+        tree_parent_ids[i] = tree_parent_id
+        rows[i] = row
+        levels[i] = level
+        is_leaf[i] = start == end
+        # popped after all descendants have been emitted
+        stack_rows[top] = row
+        stack_tree_parent_ids[top] = next_tree_id
+        stack_levels[top] = -1
+        top += 1
+        # push in reverse so the first child is popped (and numbered) first
+        for j in range(end - 1, start - 1, -1):
+            stack_rows[top] = children[j]
+            stack_tree_parent_ids[top] = next_tree_id
+            stack_levels[top] = level + 1
+            top += 1
+    return (
+        tree_parent_ids[:next_tree_id],
+        rows[:next_tree_id],
+        levels[:next_tree_id],
+        is_leaf[:next_tree_id],
+        exit_tree_ids[:next_tree_id],
+    )
+
+
+if njit is not None:
+    _build_tree_arrays = njit(cache=True)(_build_tree_arrays)
 
 
 class Tree:
@@ -48,9 +137,14 @@ class Tree:
                 raise ValueError(f"Column '{col_name}' not found in DataFrame.")
         self.id_name = id_name
         self.parent_id_name = parent_id_name
+        self._cached_result: Optional[tuple[pd.DataFrame, int]] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached tree, call it after modifying `self.df`."""
+        self._cached_result = None
 
-    def __get_parent_childs_dict(self) -> dict[int, list[int]]:
-        """Get parent-child relationships as a dictionary."""
+    def __get_parent_childs(self) -> ParentChilds:
+        """Get parent-child relationships in CSR layout."""
         df_tree = (
             self.df[
                 [
@@ -63,128 +157,94 @@ class Tree:
         )
         if df_tree.empty:
             raise ValueError("DataFrame is empty after dropping NaN and duplicates.")
-        # if parent id id not int convert to int
-        if not pd.api.types.is_integer_dtype(df_tree[self.parent_id_name]):
-            df_tree[self.parent_id_name] = df_tree[self.parent_id_name].astype(int)
-        if not pd.api.types.is_integer_dtype(df_tree[self.id_name]):
-            df_tree[self.id_name] = df_tree[self.id_name].astype(int)
-        return df_tree.groupby(self.parent_id_name)[self.id_name].apply(list).to_dict()
+        # no copy for int64 columns, float and nullable Int64 ids are converted
+        parents = df_tree[self.parent_id_name].to_numpy(dtype=np.int64)
+        children = df_tree[self.id_name].to_numpy(dtype=np.int64)
+        # remap the db_ids to dense rows
+        db_ids, inverse = np.unique(
+            np.concatenate([parents, children]), return_inverse=True
+        )
+        parent_rows = inverse[: len(parents)]
+        child_rows = inverse[len(parents) :]
+        # sort-based grouping, stable to keep the children in their original order
+        order = np.argsort(parent_rows, kind="stable")
+        offsets = np.zeros(len(db_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(parent_rows, minlength=len(db_ids)), out=offsets[1:])
+        return ParentChilds(
+            db_ids=db_ids,
+            offsets=offsets,
+            children=child_rows[order].astype(np.int64, copy=False),
+        )
 
     def get_tree(self) -> tuple[pd.DataFrame, int]:
-        """Builds the tree structure and returns it as a DataFrame."""
+        """Builds the tree structure and returns it as a DataFrame.
+
+        The result is cached, repeated calls return the same DataFrame until
+        `invalidate` is called.
+        """
+        if self._cached_result is not None:
+            return self._cached_result
         logger.info("Building tree structure")
-        pc_dict = self.__get_parent_childs_dict()
-        all_children: set[int] = set()
-        for children in pc_dict.values():
-            all_children.update(children)
-        roots = [k for k in pc_dict if k not in all_children]
+        pc = self.__get_parent_childs()
+        # roots are parents which are nobody's child
+        is_root = np.diff(pc.offsets) > 0
+        is_root[pc.children] = False
+        roots = np.flatnonzero(is_root)
         if len(roots) == 0:
             raise ValueError("No root nodes found in the tree.")
         elif len(roots) == 1:
-            root_id = roots[0]
+            root_row = int(roots[0])
+            root_id = int(pc.db_ids[root_row])
         else:
             # multiple roots found, create a fake root and add all roots as its children
-            root_id = max(pc_dict.keys()) + 1
-            pc_dict[root_id] = roots
-        root = TreeEntry(
-            tree_id=1,
-            db_id=root_id,
-            tree_parent_id=None,
-            level=0,
-            is_leaf=False,
-        )
-        tree, _ = self.__build_tree_recursive(root, pc_dict)
-        self.set_right_tree_ids(tree)
-        # rename back to the original id name
-        df = (
-            pd.DataFrame([x for x in tree.values()])
-            .rename(columns={"db_id": self.id_name})
-            .set_index("tree_id", drop=True)
+            root_id = int(pc.db_ids[np.diff(pc.offsets) > 0].max()) + 1
+            root_row = len(pc.db_ids)
+            pc = ParentChilds(
+                db_ids=np.append(pc.db_ids, root_id),
+                offsets=np.append(pc.offsets, pc.offsets[-1] + len(roots)),
+                children=np.append(pc.children, roots),
+            )
+        tree = self.__build_tree(root_row, pc)
+        # the next tree ID after the node's subtree (nested set "right" value)
+        right_tree_id = tree.exit_tree_id + 1
+        # nullable integer columns, built on the arrays without a float round-trip
+        is_root = np.zeros(len(tree.db_id), dtype=bool)
+        is_root[0] = True
+        # use the original id name for the db ids
+        df = pd.DataFrame(
+            {
+                "tree_parent_id": pd.arrays.IntegerArray(tree.tree_parent_id, is_root),
+                self.id_name: tree.db_id,
+                "level": tree.level,
+                "right_tree_id": pd.arrays.IntegerArray(
+                    right_tree_id, tree.is_leaf.copy()
+                ),
+                "is_leaf": tree.is_leaf,
+            },
+            index=pd.RangeIndex(1, len(tree.db_id) + 1, name="tree_id"),
+            copy=False,
         )
+        self._cached_result = (df, root_id)
         return df, root_id
 
-    def __build_tree_recursive(
-        self,
-        tree_entry: TreeEntry,
-        pc_dict: dict[int, list[int]],
-        level=0,
-        tree_id=1,
-        tree: Optional[dict[int, TreeEntry]] = None,
-    ):
-        """
-        Recursively builds a tree structure from parent-child relationships.
-
-        Args:
-            tree_entry (TreeEntry): The current tree entry being processed.
-            pc_dict (dict[int, list[int]]): A dictionary mapping parent db_id to
-                a list of child db_ids.
-            level (int): The current level in the tree.
-            tree_id (int): The current tree ID.
-            tree (dict[int, TreeEntry]): The tree structure being built.
-        """
-        if tree is None:
-            tree = {}
-        db_id = tree_entry.db_id
-        tree[tree_entry.tree_id] = tree_entry
-        children = pc_dict.get(db_id, [])
-        level += 1
-        for child_db_id in children:
-            new_tree_id = tree_id + 1
-            new_tree_entry = TreeEntry(
-                tree_id=new_tree_id,
-                tree_parent_id=tree_entry.tree_id,
-                db_id=child_db_id,
-                level=level,
-                is_leaf=not bool(child_db_id in pc_dict),
-            )
-            tree, tree_id = self.__build_tree_recursive(
-                tree_entry=new_tree_entry,
-                pc_dict=pc_dict,
-                level=level,
-                tree_id=new_tree_id,
-                tree=tree,
-            )
-        return tree, tree_id
-
-    def set_right_tree_ids(self, tree: dict[int, TreeEntry]):
+    def __build_tree(self, root_row: int, pc: ParentChilds) -> TreeArrays:
         """
-        Assigns the `right_tree_id` attribute for each entry in the tree.
-
-        Calculates and sets the `right_tree_id` for each `TreeEntry` in the
-        provided tree structure. The `right_tree_id` is determined based on the tree's
-        hierarchical relationships and sibling positions.
+        Builds a tree structure from parent-child relationships.
 
         Args:
-            tree (dict[int, TreeEntry]): A dictionary representing the tree structure,
-                where the keys are tree IDs and the values are `TreeEntry` objects.
+            root_row (int): The row of the root node.
+            pc (ParentChilds): The parent-child relationships.
 
-        Modifies:
-            The `right_tree_id` attribute of each `TreeEntry` in the `tree` dictionary.
+        Returns:
+            TreeArrays: The tree nodes ordered by tree ID.
         """
-
-        tree_pc_dict = defaultdict(list)
-        for child_tree_id, e in tree.items():
-            if e.tree_parent_id:
-                tree_pc_dict[e.tree_parent_id].append(child_tree_id)
-
-        tree_cp_dict = {}
-        for child_tree_id, tree_entry in tree.items():
-            if tree_entry.tree_parent_id:
-                tree_cp_dict[child_tree_id] = tree_entry.tree_parent_id
-
-        max_tree_id = max(tree_cp_dict)
-        e: TreeEntry
-        for tree_id, e in tree.items():
-            if tree_id == 1:
-                e.right_tree_id = max_tree_id + 1
-            # check if id not leaf and parent tree id exists
-            elif not e.is_leaf and e.tree_parent_id != None:
-                # get all siblings right to entry
-                sibling_tree_ids = [
-                    x for x in tree_pc_dict[e.tree_parent_id] if x > tree_id
-                ]
-                # if siblings right to entry exists get sibling with the lowest tree id
-                if sibling_tree_ids:
-                    e.right_tree_id = min(sibling_tree_ids)
-                else:
-                    e.right_tree_id = tree[e.tree_parent_id].right_tree_id
+        tree_parent_id, rows, level, is_leaf, exit_tree_id = _build_tree_arrays(
+            pc.offsets, pc.children, root_row, len(pc.children) + 1
+        )
+        return TreeArrays(
+            tree_parent_id=tree_parent_id,
+            db_id=pc.db_ids[rows],
+            level=level,
+            is_leaf=is_leaf,
+            exit_tree_id=exit_tree_id,
+        )
@@ -1,9 +1,10 @@
 import logging
 import zipfile
 from os import getenv, listdir, path
-from typing import LiteralString, cast
+from types import TracebackType
+from typing import IO, Callable, Iterable, LiteralString, cast
 
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, Session
 from rdflib import Graph
 from rdflib_neo4j import HANDLE_VOCAB_URI_STRATEGY, Neo4jStore, Neo4jStoreConfig
 from tqdm import tqdm
@@ -29,6 +30,7 @@ class Neo4jImporter:
         neo4j_uri: str | None = None,
         neo4j_user: str | None = None,
         neo4j_pwd: str | None = None,
+        batch_size: int = 50_000,
     ) -> None:
         """
         Initialize the Neo4j importer with connection credentials.
@@ -39,42 +41,106 @@ class Neo4jImporter:
                 Defaults to NEO4J_USER environment variable or NEO4J_USER constant.
             neo4j_pwd (str | None, optional): Neo4j database password.
                 Defaults to NEO4J_PASSWORD environment variable or NEO4J_PASSWORD constant.
+            batch_size (int, optional): Number of triples rdflib-neo4j commits per
+                batch. Defaults to 50_000.
         Attributes:
             neo4j_uri (str): The Neo4j connection URI used by the driver.
             neo4j_user (str): The Neo4j username for authentication.
             neo4j_pwd (str): The Neo4j password for authentication.
+            batch_size (int): Number of triples committed per batch.
             driver: Neo4j GraphDatabase driver instance for executing queries.
         Note:
             Connection parameters are resolved with the following priority:
             1. Explicitly provided parameters
             2. Environment variables (NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
             3. Module-level constants (NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
+
+            The driver is kept for the lifetime of the importer, call `close` or
+            use the importer as a context manager to release it.
         """
         self.neo4j_uri = neo4j_uri if neo4j_uri else getenv("NEO4J_URI", NEO4J_URI)
         self.neo4j_user = neo4j_user if neo4j_user else getenv("NEO4J_USER", NEO4J_USER)
         self.neo4j_pwd = (
             neo4j_pwd if neo4j_pwd else getenv("NEO4J_PASSWORD", NEO4J_PASSWORD)
         )
+        self.batch_size = batch_size
 
         self.driver = GraphDatabase.driver(
             self.neo4j_uri, auth=(self.neo4j_user, self.neo4j_pwd)
         )
+        self._constraints_ready = False
+
+    def close(self) -> None:
+        """Close the Neo4j driver."""
+        self.driver.close()
+
+    def __enter__(self) -> "Neo4jImporter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
-    def _delete_nodes_with_label(self, node_label: str = BASIC_NODE_LABEL):
+    def _delete_nodes_with_labels(
+        self, node_labels: Iterable[str] = (BASIC_NODE_LABEL,)
+    ):
         """Delete an existing graph in Neo4J.
 
+        Nodes with any of the labels are deleted in one pass. Uses
+        `apoc.periodic.iterate` if APOC is installed, otherwise falls back to
+        `CALL {} IN TRANSACTIONS`. Nothing is done if no such node exists.
+
         Args:
-            node_label (str): The label of the nodes to delete.
+            node_labels (Iterable[str]): The labels of the nodes to delete.
         """
-        logger.info("Delete an existing graph in Neo4J with node label %s.", node_label)
+        node_labels = list(node_labels)
+        logger.info(
+            "Delete an existing graph in Neo4J with node labels %s.", node_labels
+        )
+        # label predicates (instead of a $labels parameter) keep the label scans
+        where = " OR ".join(f"n:{node_label}" for node_label in node_labels)
         with self.driver.session() as session:
-            cypher: str = f"""MATCH (n:{node_label})
-                CALL (n) {{
-                WITH n
-                DETACH DELETE n
-                }} IN TRANSACTIONS OF 1000 ROWS;"""
+            exists = f"MATCH (n) WHERE {where} RETURN n LIMIT 1"
+            if session.run(cast(LiteralString, exists)).peek() is None:
+                return
+            use_apoc = self.__has_apoc_periodic_iterate(session)
+            if use_apoc:
+                cypher: str = f"""CALL apoc.periodic.iterate(
+                    "MATCH (n) WHERE {where} RETURN n",
+                    "DETACH DELETE n",
+                    {{batchSize: 10000, parallel: false}}
+                );"""
+            else:
+                cypher = f"""MATCH (n) WHERE {where}
+                    CALL (n) {{
+                    WITH n
+                    DETACH DELETE n
+                    }} IN TRANSACTIONS OF 1000 ROWS;"""
             cypher = cast(LiteralString, cypher)
-            session.run(cypher)
+            result = session.run(cypher)
+            if use_apoc:
+                # APOC reports failed batches in its result instead of raising
+                record = result.single(strict=True)
+                if record["failedBatches"]:
+                    raise RuntimeError(
+                        f"Deleting nodes with labels {node_labels} failed in "
+                        f"{record['failedBatches']} batches: {record['errorMessages']}"
+                    )
+            else:
+                result.consume()
+
+    @staticmethod
+    def __has_apoc_periodic_iterate(session: Session) -> bool:
+        """Check if the APOC procedure `apoc.periodic.iterate` is available."""
+        result = session.run(
+            "SHOW PROCEDURES YIELD name "
+            "WHERE name = 'apoc.periodic.iterate' RETURN count(*) > 0 AS available"
+        )
+        return bool(result.single(strict=True)["available"])
 
     def import_ttl(self, path_or_list: str | list[str]) -> bool:
         """Import single turtle file in Neo4J.
@@ -87,55 +153,84 @@ class Neo4jImporter:
             bool: True if import is successful.
         """
         logger.info("Start importing all turtle file in Neo4J.")
-        self._delete_nodes_with_label()
-        self._delete_nodes_with_label("DbTdwgLocation")
-        neo4j_db = self.__get_neo4j_db()
+        self._delete_nodes_with_labels((BASIC_NODE_LABEL, "DbTdwgLocation"))
+        self._ensure_constraints()
 
         if isinstance(path_or_list, list):
-            for p in path_or_list:
-                neo4j_db.parse(p, format="ttl")
+            self.__parse_ttls(path_or_list)
         elif path_or_list.endswith(".ttl"):
-            neo4j_db.parse(path_or_list, format="ttl")
+            self.__parse_ttls([path_or_list])
         elif path.isdir(path_or_list):
             ttl_files = [
                 path.join(path_or_list, f)
                 for f in listdir(path_or_list)
                 if f.endswith(".ttl")
             ]
-            with tqdm(ttl_files) as pbar:
-                for ttl_file in pbar:
-                    pbar.set_description(f"Processing {ttl_file}")
-                    neo4j_db.parse(ttl_file, format="ttl")
+            self.__parse_ttls(ttl_files)
         elif path_or_list.endswith(".zip"):
-            self.__import_turtle_files_from_zip(path, neo4j_db)
-        neo4j_db.close(True)
+            self.__import_turtle_files_from_zip(path_or_list)
 
         return True
 
-    def __import_turtle_files_from_zip(self, path_ttl_file_or_zip, neo4j_db):
+    def __import_turtle_files_from_zip(self, path_ttl_file_or_zip):
         """Import turtle files from a zip file into Neo4J.
         Args:
             path_ttl_file_or_zip (str): Path to the zip file containing turtle files.
-            neo4j_db (Graph): The Neo4J Graph database connection.
         """
-        with zipfile.ZipFile(path_ttl_file_or_zip, "r") as z:
+        with (
+            open(path_ttl_file_or_zip, "rb", buffering=1 << 20) as zip_file,
+            zipfile.ZipFile(zip_file, "r") as z,
+        ):
             turtle_file_names = [x for x in z.namelist() if x.endswith(".ttl")]
-            with tqdm(turtle_file_names) as pbar:
-                for turtle_file_name in pbar:
-                    pbar.set_description(f"Processing {turtle_file_name}")
-                    with z.open(turtle_file_name) as file_io:
-                        neo4j_db.parse(file_io, format="ttl")
+            self.__parse_ttls(turtle_file_names, open_file=z.open)
 
-    def __get_neo4j_db(self) -> Graph:
-        """Get the Neo4j Graph database connection."""
+    def __parse_ttls(
+        self, names: list[str], open_file: Callable[[str], IO[bytes]] | None = None
+    ) -> None:
+        """Parse turtle files into Neo4J one after another.
+
+        The files share nodes (every plant is in the plants and the locations file,
+        every area in the locations and the TDWG file), so they are written through
+        a single Neo4jStore; concurrent stores would MERGE the same nodes in
+        different orders and deadlock.
+
+        Args:
+            names (list[str]): Paths of the turtle files, or names passed to
+                `open_file`.
+            open_file (Callable[[str], IO[bytes]] | None): Opens the content for a
+                name. If None, the names are parsed as file paths.
+        """
+        graph = self.__get_neo4j_db()
+        try:
+            with tqdm(names) as pbar:
+                for name in pbar:
+                    pbar.set_description(f"Processing {name}")
+                    if open_file:
+                        with open_file(name) as file_io:
+                            graph.parse(file_io, format="ttl")
+                    else:
+                        graph.parse(name, format="ttl")
+        finally:
+            # commits the remaining batch
+            graph.close(True)
+
+    def _ensure_constraints(self) -> None:
+        """Create the unique URI constraint used by rdflib-neo4j.
+
+        Runs only once per importer, later calls are no-ops.
+        """
+        if self._constraints_ready:
+            return
         with self.driver.session() as session:
             cypher = (
                 "CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS "
                 "FOR (r:Resource) REQUIRE r.uri IS UNIQUE"
             )
             session.run(cypher)
-            self.driver.close()
+        self._constraints_ready = True
 
+    def __get_neo4j_db(self) -> Graph:
+        """Get the Neo4j Graph database connection."""
         auth_data = {
             "uri": self.neo4j_uri,
             "database": "neo4j",
@@ -148,6 +243,7 @@ class Neo4jImporter:
             custom_prefixes={},
             handle_vocab_uri_strategy=HANDLE_VOCAB_URI_STRATEGY.IGNORE,
             batching=True,
+            batch_size=self.batch_size,
         )
 
         neo4j_db = Graph(store=Neo4jStore(config=config))
@@ -163,11 +259,10 @@ class Neo4jImporter:
         logger.info("Start importing all turtle file in Neo4J.")
 
         if delete_existing_graph:
-            self._delete_nodes_with_label()
-        neo4j_db = self.__get_neo4j_db()
+            self._delete_nodes_with_labels()
+        self._ensure_constraints()
 
-        self.__import_turtle_files_from_zip(ZIPPED_TTLS_PATH, neo4j_db)
-        neo4j_db.close(True)
+        self.__import_turtle_files_from_zip(ZIPPED_TTLS_PATH)
 
         return True
 
@@ -188,8 +283,8 @@ def import_ttls(
     Returns:
         bool: True if import is successful.
     """
-    importer = Neo4jImporter(
+    with Neo4jImporter(
         neo4j_uri=neo4j_uri, neo4j_user=neo4j_user, neo4j_pwd=neo4j_pwd
-    )
-    result: bool = importer.import_ttls(delete_existing_graph=delete_existing_graph)
+    ) as importer:
+        result: bool = importer.import_ttls(delete_existing_graph=delete_existing_graph)
     return result
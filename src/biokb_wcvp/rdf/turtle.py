@@ -6,12 +6,22 @@ into RDF Turtle format, suitable for semantic web applications and knowledge gra
 
 import logging
 import os.path
+import re
 import shutil
-from typing import List, Optional, Type, TypeVar
+import threading
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import groupby
+from operator import itemgetter
+from types import TracebackType
+from typing import Callable, Optional, TextIO, Type, TypeVar
 from urllib.parse import urlparse
 
-from rdflib import RDF, XSD, Graph, Literal, Namespace, URIRef
-from sqlalchemy import Engine, create_engine, select
+from rdflib import RDF, XSD, Graph, Namespace, URIRef
+from rdflib.term import Node
+from sqlalchemy import URL, Engine, String, case, cast, create_engine, func, select
 from sqlalchemy.orm import sessionmaker
 from tqdm import tqdm
 
@@ -32,16 +42,79 @@ from biokb_wcvp.rdf import namespaces
 BaseModels = TypeVar("BaseModels", bound=models.Base)
 
 
+@cache
 def get_namespace(model: Type[models.Base]) -> Namespace:
     """Generate an RDF namespace for a given SQLAlchemy model class.
 
+    The namespace is created once per model class and cached.
+
     Args:
         model: SQLAlchemy model class to generate namespace for.
 
     Returns:
         RDF Namespace object with URI based on the model's class name.
     """
-    return Namespace(f"{namespaces.BASE_URI}/{model.__name__}#")
+    return Namespace(f"{namespaces.BASE_URI}{model.__name__}#")
+
+
+def iri_formatter(namespace: Namespace) -> Callable[[object], str]:
+    """Get a function which formats local names of a namespace as turtle IRIs.
+
+    The namespace prefix is concatenated once, so no URIRef is created per call.
+    Local names must not contain characters which need escaping in IRIs.
+
+    Args:
+        namespace: Namespace of the IRIs.
+
+    Returns:
+        Function returning `<namespace + local name>` for a local name.
+    """
+    prefix = f"<{namespace}"
+
+    def format_iri(local_name: object) -> str:
+        return f"{prefix}{local_name}>"
+
+    return format_iri
+
+
+# Escapes of characters which are not allowed unescaped in turtle string literals
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def string_literal(value: str) -> str:
+    """Format a string as turtle literal with datatype xsd:string.
+
+    The datatype is written as `x:string`, the `x` prefix is declared in the
+    header of files written by `TurtleWriter`.
+
+    Args:
+        value: Lexical value of the literal.
+
+    Returns:
+        Literal in turtle syntax.
+    """
+    # substring checks are memchr scans, cheaper than a regex per value
+    if '"' in value or "\\" in value or "\n" in value or "\r" in value:
+        value = value.translate(_LITERAL_ESCAPES)
+    return f'"{value}"^^x:string'
+
+
+# Prefixes bound in graphs created by get_empty_graph
+GRAPH_PREFIXES: dict[str, Namespace] = {
+    # generic ontology namespaces
+    "n": namespaces.NODE_NS,
+    "r": namespaces.REL_NS,
+    "x": Namespace(str(XSD)),
+    # geographic namespaces (TDWG World Geographical Scheme)
+    "c": namespaces.CONTINENT_NS,
+    "e": namespaces.REGION_NS,
+    "a": namespaces.AREA_NS,
+    # taxonomic and identifier namespaces
+    "p": get_namespace(models.Plant),
+    "o": namespaces.POWO_NS,
+    "i": namespaces.IPNI_NS,
+    "t": namespaces.NCBI_TAXON_NS,
+}
 
 
 def get_empty_graph() -> Graph:
@@ -57,29 +130,130 @@ def get_empty_graph() -> Graph:
     - ip: IPNI (International Plant Names Index) identifiers
     - nc: NCBI Taxonomy identifiers
 
+    rdflib's default bindings are skipped, only the prefixes of
+    `GRAPH_PREFIXES` are bound.
+
     Returns:
         An RDFlib Graph object with all namespace bindings configured.
     """
-    graph = Graph()
-    # Bind generic ontology namespaces
-    graph.bind(prefix="n", namespace=namespaces.NODE_NS)
-    graph.bind(prefix="r", namespace=namespaces.REL_NS)
-    graph.bind(prefix="x", namespace=XSD)
-
-    # Bind geographic namespaces (TDWG World Geographical Scheme)
-    graph.bind(prefix="c", namespace=namespaces.CONTINENT_NS)
-    graph.bind(prefix="e", namespace=namespaces.REGION_NS)
-    graph.bind(prefix="a", namespace=namespaces.AREA_NS)
-
-    # Bind taxonomic and identifier namespaces
-    graph.bind(prefix="p", namespace=get_namespace(models.Plant))
-    graph.bind(prefix="o", namespace=namespaces.POWO_NS)
-    graph.bind(prefix="i", namespace=namespaces.IPNI_NS)
-    graph.bind(prefix="t", namespace=namespaces.NCBI_TAXON_NS)
-
+    graph = Graph(bind_namespaces="none")
+    bind = graph.namespace_manager.bind
+    for prefix, namespace in GRAPH_PREFIXES.items():
+        bind(prefix, namespace)
     return graph
 
 
+# Prefixes written to the header of each turtle file
+PREFIXES: dict[str, Namespace] = {
+    "n": namespaces.NODE_NS,
+    "r": namespaces.REL_NS,
+    "x": Namespace(str(XSD)),
+}
+
+# Buffer size for writing and copying turtle files, large sequential writes
+WRITE_BUFFER_SIZE = 4 << 20
+
+# Default upper limit of worker processes for a parallel export, every worker
+# scans the plant table with its own database connection
+MAX_WORKERS = 8
+
+# Local names which can be written as prefixed names without escaping
+_SIMPLE_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Shard files of a turtle file, e.g. wcvp_plants.part3.ttl
+_SHARD_FILE_NAME = re.compile(r"(?P<name>.+)\.part(?P<shard>\d+)\.ttl")
+
+
+class TurtleWriter:
+    """Streams turtle statements to a file without building a graph.
+
+    All predicate-object pairs of a subject are written as one statement,
+    separated by ';', objects of consecutive pairs with the same predicate
+    are separated by ','. Statements are buffered and written in batches.
+
+    Args:
+        path: Path of the file to write.
+        batch_size: Number of statements buffered before they are written.
+    """
+
+    def __init__(self, path: str, batch_size: int = 50_000):
+        self.path = path
+        self.batch_size = batch_size
+        self._file: Optional[TextIO] = None
+        self._statements: list[str] = []
+
+    def __enter__(self) -> "TurtleWriter":
+        self._file = open(self.path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        self._file.writelines(
+            f"@prefix {prefix}: <{namespace}> .\n"
+            for prefix, namespace in PREFIXES.items()
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._file:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def term(term: Node) -> str:
+        """Format a term, as prefixed name if its namespace is in the header.
+
+        Meant for constant terms like predicates and types, which are formatted
+        once and then reused.
+
+        Args:
+            term: RDF term.
+
+        Returns:
+            The term in turtle syntax.
+        """
+        if term == RDF.type:
+            return "a"
+        for prefix, namespace in PREFIXES.items():
+            local_name = str(term)[len(namespace) :]
+            if (
+                isinstance(term, URIRef)
+                and term.startswith(namespace)
+                and _SIMPLE_LOCAL_NAME.fullmatch(local_name)
+            ):
+                return f"{prefix}:{local_name}"
+        return term.n3()
+
+    def add(self, subject: str, predicate_objects: list[tuple[str, str]]) -> None:
+        """Add a statement with all predicate-object pairs of a subject.
+
+        Args:
+            subject: Subject in turtle syntax.
+            predicate_objects: Predicates and objects in turtle syntax.
+        """
+        parts = [subject]
+        previous = None
+        for predicate, obj in predicate_objects:
+            if predicate == previous:
+                parts.append(f", {obj}")
+            else:
+                if previous is not None:
+                    parts.append(" ;\n   ")
+                parts.append(f" {predicate} {obj}")
+                previous = predicate
+        parts.append(" .\n")
+        self._statements.append("".join(parts))
+        if len(self._statements) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered statements to the file."""
+        self._file.writelines(self._statements)  # type: ignore[union-attr]
+        self._statements.clear()
+
+
 class TurtleCreator:
     """Factory class for generating RDF Turtle files from WCVP database.
 
@@ -143,7 +317,9 @@ class TurtleCreator:
         """
         self.__ttls_folder = export_to_folder
 
-    def create_ttls(self) -> str:
+    def create_ttls(
+        self, parallel: bool = True, max_workers: Optional[int] = None
+    ) -> str:
         """Create all RDF turtle files and package them into a zip archive.
 
         This method orchestrates the complete export process:
@@ -152,74 +328,116 @@ class TurtleCreator:
         3. Links plants to their geographic distributions
         4. Packages all turtle files into a zip archive
 
+        Steps 1-3 write independent files and run in separate processes if
+        `parallel` is True and the database is not an in-memory SQLite database.
+        Plants and locations are additionally split into one shard per worker by
+        plant ID, the shard files are concatenated into the zip archive.
+
+        Args:
+            parallel: Create the turtle files in parallel processes.
+            max_workers: Number of worker processes. Defaults to the number of
+                CPUs, but at most `MAX_WORKERS`.
+
         Returns:
             Path to the created zip file containing all turtle files.
         """
         logging.info("Starting turtle file generation process.")
 
-        # Generate individual turtle files in order
-        self.create_tdwg_locations()  # Geographic hierarchy
-        self.create_locations()  # distribution links
-        self.create_plants()  # taxonomic data
+        url = self.__engine.url
+        in_memory = url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        )
+        num_shards = max_workers or min(MAX_WORKERS, os.cpu_count() or 1)
+        if parallel and num_shards > 1 and not in_memory:
+            tasks: list[tuple[str, Optional[tuple[int, int]]]] = [
+                ("create_tdwg_locations", None)
+            ]
+            for name in ("create_locations", "create_plants"):
+                tasks += [(name, (k, num_shards)) for k in range(num_shards)]
+            # each process opens its own engine, engines must not cross processes
+            with ProcessPoolExecutor(max_workers=num_shards) as executor:
+                futures = [
+                    executor.submit(
+                        _run_in_process, url, self.__ttls_folder, name, shard
+                    )
+                    for name, shard in tasks
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            self.create_tdwg_locations()  # Geographic hierarchy
+            self.create_locations()  # distribution links
+            self.create_plants()  # taxonomic data
 
         # Package everything into a zip file
         path_to_zip_file: str = self.create_zip_from_all_ttls()
         logging.info(f"Turtle files successfully packaged in {path_to_zip_file}")
         return path_to_zip_file
 
-    def create_locations(self):
+    def __shard_path(self, file_name: str, shard: Optional[tuple[int, int]]) -> str:
+        """Path of a turtle file, or of one shard of it."""
+        if shard:
+            file_name = file_name.replace(".ttl", f".part{shard[0]}.ttl")
+        return os.path.join(self.__ttls_folder, file_name)
+
+    def create_locations(self, shard: Optional[tuple[int, int]] = None):
         """Create RDF triples linking plants to their geographic distributions.
 
         For each accepted plant name, this creates HAS_LOCATION relationships to TDWG
         geographic units at the most specific level available (Area > Region > Continent).
+
+        Args:
+            shard: Optional (k, number of shards), only plants with
+                plant ID % number of shards == k are exported to a part file.
         """
         logging.info("Creating RDF plant distribution turtle file.")
-        graph = get_empty_graph()
-
-        with self.Session() as session:
-            stmt = select(
-                models.Location.wcvp_plant_id,
-                models.Location.code_l1,
-                models.Location.code_l2,
-                models.Location.code_l3,
+        ttl_path = self.__shard_path("wcvp_locations.ttl", shard)
+
+        with self.Session() as session, TurtleWriter(ttl_path) as writer:
+            # the most specific TDWG level and code of each location
+            location = models.Location
+            level = case(
+                (location.code_l3.is_not(None), 3),
+                (location.code_l2.is_not(None), 2),
+                else_=1,
+            )
+            code = func.coalesce(
+                location.code_l3,
+                cast(location.code_l2, String),
+                cast(location.code_l1, String),
+            )
+            stmt = select(location.wcvp_plant_id, level, code).where(code.is_not(None))
+            if shard:
+                stmt = stmt.where(models.Location.wcvp_plant_id % shard[1] == shard[0])
+            # stream rows with a server-side cursor instead of loading all
+            results = session.execute(
+                stmt.execution_options(stream_results=True, yield_per=10_000)
             )
-            results = session.execute(stmt).all()
-
-            plant_namespace: Namespace = get_namespace(models.Plant)
-
-            for r in tqdm(results, desc="Creating plant-location links"):
-                p: URIRef = plant_namespace[str(r.wcvp_plant_id)]
-                if r.code_l3:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["HAS_LOCATION"],
-                            namespaces.AREA_NS[str(r.code_l3)],
-                        )
-                    )
-                elif r.code_l2:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["HAS_LOCATION"],
-                            namespaces.REGION_NS[r.code_l2],
-                        )
-                    )
-                elif r.code_l1:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["HAS_LOCATION"],
-                            namespaces.CONTINENT_NS[r.code_l1],
-                        )
-                    )
-
-        # Serialize and save the graph
-        ttl_path = os.path.join(self.__ttls_folder, "wcvp_locations.ttl")
-        graph.serialize(ttl_path, format="turtle")
-        del graph
 
-    def create_plants(self):
+            # constant terms, formatted once instead of per row
+            plant_iri = iri_formatter(get_namespace(models.Plant))
+            has_location = writer.term(namespaces.REL_NS["HAS_LOCATION"])
+            # IRI formatters by TDWG level
+            location_iri = {
+                1: iri_formatter(namespaces.CONTINENT_NS),
+                2: iri_formatter(namespaces.REGION_NS),
+                3: iri_formatter(namespaces.AREA_NS),
+            }
+            add = writer.add
+
+            # locations of a plant are mostly consecutive, so each run of rows
+            # with the same plant is written as one statement with one subject
+            rows = tqdm(results, desc="Creating plant-location links")
+            for plant_id, plant_rows in groupby(rows, key=itemgetter(0)):
+                pairs = [
+                    (has_location, location_iri[level](code))
+                    for _, level, code in plant_rows
+                ]
+                add(plant_iri(plant_id), pairs)
+
+    def create_plants(self, shard: Optional[tuple[int, int]] = None):
         """Create RDF nodes for all accepted plant taxonomic names.
 
         For each plant, this creates:
@@ -227,86 +445,66 @@ class TurtleCreator:
         - External identifier links (IPNI, POWO, NCBI Taxonomy)
         - Taxonomic name as literal
         - Parent taxon relationship for hierarchical navigation
+
+        Args:
+            shard: Optional (k, number of shards), only plants with
+                plant ID % number of shards == k are exported to a part file.
         """
         logging.info("Creating RDF plant taxonomy turtle file.")
-        graph = get_empty_graph()
-
-        with self.Session() as session:
-            # Query only accepted plant names (excluding synonyms)
-            plants: List[models.Plant] = (
-                session.query(models.Plant)
-                .where(
-                    models.Plant.accepted_plant_name_id == models.Plant.plant_name_id
-                )
-                .all()
+        ttl_path = self.__shard_path("wcvp_plants.ttl", shard)
+
+        with self.Session() as session, TurtleWriter(ttl_path) as writer:
+            # Query only accepted plant names (excluding synonyms), as plain rows
+            stmt = select(
+                models.Plant.plant_name_id,
+                models.Plant.ipni_id,
+                models.Plant.powo_id,
+                models.Plant.taxon_name,
+                models.Plant.parent_plant_name_id,
+                models.Plant.tax_id,
+            ).where(models.Plant.accepted_plant_name_id == models.Plant.plant_name_id)
+            if shard:
+                stmt = stmt.where(models.Plant.plant_name_id % shard[1] == shard[0])
+            plants = session.execute(
+                stmt.execution_options(stream_results=True, yield_per=10_000)
             )
 
-            plant_namespace: Namespace = get_namespace(models.Plant)
+            # constant terms, formatted once instead of per row
+            plant_iri = iri_formatter(get_namespace(models.Plant))
+            term = writer.term
+            rdf_type = term(RDF.type)
+            plant_type = term(namespaces.NODE_NS[models.Plant.__name__])
+            basic_type = term(namespaces.NODE_NS[BASIC_NODE_LABEL])
+            same_as = term(namespaces.REL_NS["SAME_AS"])
+            taxon_name = term(namespaces.REL_NS["taxon_name"])
+            has_parent = term(namespaces.REL_NS["HAS_PARENT"])
+            ipni_iri = iri_formatter(namespaces.IPNI_NS)
+            powo_iri = iri_formatter(namespaces.POWO_NS)
+            ncbi_taxon_iri = iri_formatter(namespaces.NCBI_TAXON_NS)
+            add = writer.add
 
             for plant in tqdm(plants, desc="Creating plant taxonomy nodes"):
-                p: URIRef = plant_namespace[str(plant.plant_name_id)]
-
                 # Add type declarations
-                graph.add(
-                    triple=(
-                        p,
-                        RDF.type,
-                        namespaces.NODE_NS[models.Plant.__name__],
-                    )
-                )
-                graph.add(triple=(p, RDF.type, namespaces.NODE_NS[BASIC_NODE_LABEL]))
+                pairs = [(rdf_type, plant_type), (rdf_type, basic_type)]
 
                 # Link to external plant name databases if available
                 if plant.ipni_id:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["SAME_AS"],
-                            namespaces.IPNI_NS[plant.ipni_id],
-                        )
-                    )
+                    pairs.append((same_as, ipni_iri(plant.ipni_id)))
                 if plant.powo_id:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["SAME_AS"],
-                            namespaces.POWO_NS[plant.powo_id],
-                        )
-                    )
+                    pairs.append((same_as, powo_iri(plant.powo_id)))
 
                 # Add the taxonomic name as a literal string
-                graph.add(
-                    triple=(
-                        p,
-                        namespaces.REL_NS["taxon_name"],
-                        Literal(lexical_or_value=plant.taxon_name, datatype=XSD.string),
-                    )
-                )
+                pairs.append((taxon_name, string_literal(plant.taxon_name)))
 
                 # Link to parent taxon for hierarchical structure
                 if plant.parent_plant_name_id:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["HAS_PARENT"],
-                            plant_namespace[str(plant.parent_plant_name_id)],
-                        )
-                    )
+                    pairs.append((has_parent, plant_iri(plant.parent_plant_name_id)))
 
                 # Link to NCBI Taxonomy if available
                 if plant.tax_id:
-                    graph.add(
-                        triple=(
-                            p,
-                            namespaces.REL_NS["SAME_AS"],
-                            namespaces.NCBI_TAXON_NS[str(int(plant.tax_id))],
-                        )
-                    )
+                    pairs.append((same_as, ncbi_taxon_iri(plant.tax_id)))
 
-        # Serialize and save the graph
-        ttl_path = os.path.join(self.__ttls_folder, "wcvp_plants.ttl")
-        graph.serialize(ttl_path, format="turtle")
-        del graph
+                add(plant_iri(plant.plant_name_id), pairs)
 
     def create_tdwg_locations(self):
         """Create RDF turtle file for TDWG World Geographical Scheme for Recording Plant Distributions.
@@ -319,129 +517,169 @@ class TurtleCreator:
         Each level includes name literals and hierarchical relationships (HAS_REGION, HAS_AREA).
         """
         logging.info("Creating RDF TDWG geographic hierarchy turtle file.")
-        graph = get_empty_graph()
-
-        with self.Session() as session:
-            # Retrieve all continents (Level 1) with their nested regions and areas
-            continents: List[models.GeoLocationLevel1] = session.query(
-                models.GeoLocationLevel1
-            ).all()
+        ttl_path = os.path.join(self.__ttls_folder, "tdwg_locations.ttl")
 
-            for continent in tqdm(
-                continents, desc="Creating TDWG Level 1 (Continents) entries"
+        L1 = models.GeoLocationLevel1
+        L2 = models.GeoLocationLevel2
+        L3 = models.GeoLocationLevel3
+
+        with self.Session() as session, TurtleWriter(ttl_path) as writer:
+            # Retrieve the whole hierarchy as flat rows in one query
+            stmt = (
+                select(L1.code, L1.name, L2.code, L2.name, L3.code, L3.name)
+                .outerjoin(L2, L2.level_1_code == L1.code)
+                .outerjoin(L3, L3.level_2_code == L2.code)
+                .order_by(L1.code, L2.code, L3.code)
+            )
+            rows = session.execute(stmt).all()
+
+            # constant terms, formatted once instead of per row
+            term = writer.term
+            rdf_type = term(RDF.type)
+            continent_type = term(namespaces.NODE_NS["Continent"])
+            region_type = term(namespaces.NODE_NS["Region"])
+            area_type = term(namespaces.NODE_NS["Area"])
+            tdwg_type = term(namespaces.NODE_NS["DbTdwgLocation"])
+            continent_name = term(namespaces.REL_NS["continent"])
+            region_name = term(namespaces.REL_NS["region"])
+            area_name = term(namespaces.REL_NS["area"])
+            has_region = term(namespaces.REL_NS["HAS_REGION"])
+            has_area = term(namespaces.REL_NS["HAS_AREA"])
+            # continent and region names repeat in many rows, format them once
+            literal = cache(string_literal)
+            continent_iri = iri_formatter(namespaces.CONTINENT_NS)
+            region_iri = iri_formatter(namespaces.REGION_NS)
+            area_iri = iri_formatter(namespaces.AREA_NS)
+
+            # predicate-object pairs per subject; continents and regions appear
+            # in several rows but are declared only once
+            statements: dict[str, list[tuple[str, str]]] = {}
+            for l1_code, l1_name, l2_code, l2_name, l3_code, l3_name in tqdm(
+                rows, desc="Creating TDWG location entries"
             ):
-                # Create Level 1 (Continent) node
-                l1: URIRef = namespaces.CONTINENT_NS[str(continent.code)]
-                graph.add(triple=(l1, RDF.type, namespaces.NODE_NS["Continent"]))
-                graph.add(triple=(l1, RDF.type, namespaces.NODE_NS["DbTdwgLocation"]))
-                graph.add(
-                    triple=(
-                        l1,
-                        namespaces.REL_NS["continent"],
-                        Literal(continent.name, datatype=XSD.string),
-                    )
-                )
-
-                # Process Level 2 (Regions) within this continent
-                for region in continent.regions:
-                    l2: URIRef = namespaces.REGION_NS[str(region.code)]
-                    graph.add(triple=(l2, RDF.type, namespaces.NODE_NS["Region"]))
-                    graph.add(
-                        triple=(l2, RDF.type, namespaces.NODE_NS["DbTdwgLocation"])
-                    )
-                    graph.add(
-                        triple=(
-                            l2,
-                            namespaces.REL_NS["continent"],
-                            Literal(continent.name, datatype=XSD.string),
-                        )
-                    )
-
-                    graph.add(
-                        triple=(
-                            l2,
-                            namespaces.REL_NS["region"],
-                            Literal(region.name, datatype=XSD.string),
-                        )
-                    )
-
-                    # Link region to its parent continent
-                    graph.add(
-                        triple=(
-                            l1,
-                            namespaces.REL_NS["HAS_REGION"],
-                            l2,
-                        )
-                    )
-
-                    # Process Level 3 (Areas) within this region
-                    for area in region.areas:
-                        l3: URIRef = namespaces.AREA_NS[str(area.code)]
-                        graph.add(triple=(l3, RDF.type, namespaces.NODE_NS["Area"]))
-                        graph.add(
-                            triple=(l3, RDF.type, namespaces.NODE_NS["DbTdwgLocation"])
-                        )
-                        graph.add(
-                            triple=(
-                                l3,
-                                namespaces.REL_NS["continent"],
-                                Literal(continent.name, datatype=XSD.string),
-                            )
-                        )
-
-                        graph.add(
-                            triple=(
-                                l3,
-                                namespaces.REL_NS["region"],
-                                Literal(region.name, datatype=XSD.string),
-                            )
-                        )
-                        graph.add(
-                            triple=(
-                                l3,
-                                namespaces.REL_NS["area"],
-                                Literal(area.name, datatype=XSD.string),
-                            )
-                        )
-                        # Link area to its parent region
-                        graph.add(
-                            triple=(
-                                l2,
-                                namespaces.REL_NS["HAS_AREA"],
-                                l3,
-                            )
-                        )
-
-        # Serialize and save the graph
-        ttl_path = os.path.join(self.__ttls_folder, "tdwg_locations.ttl")
-        graph.serialize(ttl_path, format="turtle")
-        del graph
+                # Level 1 (Continent) node
+                l1 = continent_iri(l1_code)
+                l1_literal = literal(l1_name)
+                if l1 not in statements:
+                    statements[l1] = [
+                        (rdf_type, continent_type),
+                        (rdf_type, tdwg_type),
+                        (continent_name, l1_literal),
+                    ]
+                if l2_code is None:
+                    continue
+
+                # Level 2 (Region) node, linked to its parent continent
+                l2 = region_iri(l2_code)
+                l2_literal = literal(l2_name)
+                if l2 not in statements:
+                    statements[l1].append((has_region, l2))
+                    statements[l2] = [
+                        (rdf_type, region_type),
+                        (rdf_type, tdwg_type),
+                        (continent_name, l1_literal),
+                        (region_name, l2_literal),
+                    ]
+                if l3_code is None:
+                    continue
+
+                # Level 3 (Area) node, linked to its parent region
+                l3 = area_iri(l3_code)
+                statements[l2].append((has_area, l3))
+                statements[l3] = [
+                    (rdf_type, area_type),
+                    (rdf_type, tdwg_type),
+                    (continent_name, l1_literal),
+                    (region_name, l2_literal),
+                    (area_name, string_literal(l3_name)),
+                ]
+
+            for subject, pairs in statements.items():
+                writer.add(subject, pairs)
 
     def create_zip_from_all_ttls(self) -> str:
         """Package all generated turtle files into a single zip archive.
 
         Creates a zip file containing all .ttl files in the export folder,
         then removes the temporary turtle files directory to clean up.
+        Shard files (`<name>.part<k>.ttl`) are concatenated in shard order
+        into one `<name>.ttl` member while they are compressed. Files are
+        compressed with the fastest deflate level, the removal of the
+        directory runs in a background thread.
 
         Returns:
             Path to the created zip file.
         """
         logger.info("Packaging turtle files into zip archive.")
 
-        # Create zip archive from all turtle files
-        path_to_zip_file = shutil.make_archive(
-            base_name=self.__ttls_folder, format="zip", root_dir=self.__ttls_folder
-        )
+        # Files of each archive member, shards in shard order
+        members: dict[str, list[tuple[int, str]]] = {}
+        for file_name in os.listdir(self.__ttls_folder):
+            match = _SHARD_FILE_NAME.fullmatch(file_name)
+            if match:
+                member = f"{match['name']}.ttl"
+                members.setdefault(member, []).append((int(match["shard"]), file_name))
+            else:
+                members.setdefault(file_name, []).append((0, file_name))
 
-        # Clean up temporary turtle files directory
-        shutil.rmtree(self.__ttls_folder)
+        # Create zip archive from all turtle files
+        path_to_zip_file = f"{self.__ttls_folder}.zip"
+        with zipfile.ZipFile(
+            path_to_zip_file,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=1,
+            allowZip64=True,
+        ) as zf:
+            for member, files in sorted(members.items()):
+                with zf.open(member, "w", force_zip64=True) as target:
+                    for _, file_name in sorted(files):
+                        file_path = os.path.join(self.__ttls_folder, file_name)
+                        with open(file_path, "rb", buffering=0) as source:
+                            shutil.copyfileobj(source, target, WRITE_BUFFER_SIZE)
+
+        # Clean up temporary turtle files directory, renamed first so that
+        # the folder can be recreated while the old one is still removed
+        trash_folder = f"{self.__ttls_folder}.{uuid.uuid4().hex}.trash"
+        os.rename(self.__ttls_folder, trash_folder)
+        threading.Thread(target=shutil.rmtree, args=(trash_folder,)).start()
 
         return path_to_zip_file
 
 
+def _run_in_process(
+    url: URL,
+    ttls_folder: str,
+    method_name: str,
+    shard: Optional[tuple[int, int]] = None,
+) -> None:
+    """Run a single create_* method of a new TurtleCreator in a worker process.
+
+    Args:
+        url: URL of the database.
+        ttls_folder: Folder to write the turtle file to.
+        method_name: Name of the TurtleCreator method to call.
+        shard: Optional (k, number of shards) passed to the method.
+    """
+    engine = create_engine(url)
+    try:
+        ttl_creator = TurtleCreator(
+            engine=engine, export_to_folder=os.path.dirname(ttls_folder)
+        )
+        ttl_creator._set_ttls_folder(ttls_folder)
+        if shard:
+            getattr(ttl_creator, method_name)(shard=shard)
+        else:
+            getattr(ttl_creator, method_name)()
+    finally:
+        engine.dispose()
+
+
 def create_ttls(
     engine: Optional[Engine] = None,
     export_to_folder: Optional[str] = None,
+    parallel: bool = True,
+    max_workers: Optional[int] = None,
 ) -> str:
     """Create all turtle files.
 
@@ -453,6 +691,10 @@ def create_ttls(
         engine (Engine | None, optional): SQLAlchemy class. Defaults to None.
         export_to_folder (str | None, optional): Folder to export ttl files.
             Defaults to None.
+        parallel (bool, optional): Create the turtle files in parallel processes.
+            Defaults to True.
+        max_workers (int | None, optional): Number of worker processes. Defaults to
+            None, the number of CPUs but at most MAX_WORKERS.
 
     Returns:
         str: path zipped file with ttls.
@@ -460,4 +702,4 @@ def create_ttls(
     ttl_creator = TurtleCreator(engine=engine)
     if export_to_folder:
         ttl_creator._set_ttls_folder(export_to_folder)
-    return ttl_creator.create_ttls()
+    return ttl_creator.create_ttls(parallel=parallel, max_workers=max_workers)
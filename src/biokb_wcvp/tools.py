@@ -1,7 +1,9 @@
 import logging
 import os
+import shutil
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 from biokb_wcvp.constants import (
     DATA_FOLDER,
@@ -13,6 +15,9 @@ from biokb_wcvp.constants import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chunk size for copying downloaded data to disk
+CHUNK_SIZE = 1 << 20
+
 
 def download_and_unzip(force_download: bool = False) -> str:
     """Download WCVP data in local download folder, unzipped and return path.
@@ -26,12 +31,42 @@ def download_and_unzip(force_download: bool = False) -> str:
     os.makedirs(DATA_FOLDER, exist_ok=True)
     if force_download or not os.path.exists(PATH_TO_ZIP_FILE):
         logger.info(f"Downloading data")
-        urllib.request.urlretrieve(DOWNLOAD_URL, PATH_TO_ZIP_FILE)
+        # download to a temporary file first, so that an interrupted download
+        # does not leave an incomplete zip file behind
+        tmp_path = f"{PATH_TO_ZIP_FILE}.part"
+        with (
+            urllib.request.urlopen(DOWNLOAD_URL) as response,
+            open(tmp_path, "wb") as f,
+        ):
+            shutil.copyfileobj(response, f, CHUNK_SIZE)
+        os.replace(tmp_path, PATH_TO_ZIP_FILE)
     else:
         logger.info(f"{PATH_TO_ZIP_FILE} already exists. Skipping download.")
 
+    os.makedirs(DEFAULT_PATH_UNZIPPED_DATA_FOLDER, exist_ok=True)
     with zipfile.ZipFile(PATH_TO_ZIP_FILE, "r") as zip_ref:
-        os.makedirs(DEFAULT_PATH_UNZIPPED_DATA_FOLDER, exist_ok=True)
-        zip_ref.extractall(DEFAULT_PATH_UNZIPPED_DATA_FOLDER)
+        # directories are extracted first, so that threads do not race on them
+        names = []
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                zip_ref.extract(info, DEFAULT_PATH_UNZIPPED_DATA_FOLDER)
+            else:
+                names.append(info.filename)
+    # zlib releases the GIL, so members are decompressed in parallel threads
+    max_workers = max(1, min(len(names), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_extract_member, names))
 
     return DEFAULT_PATH_UNZIPPED_DATA_FOLDER
+
+
+def _extract_member(name: str) -> None:
+    """Extract a single member of the WCVP zip file.
+
+    Each call opens its own ZipFile, so threads do not share a file handle.
+
+    Args:
+        name (str): Name of the member in the zip file.
+    """
+    with zipfile.ZipFile(PATH_TO_ZIP_FILE, "r") as zip_ref:
+        zip_ref.extract(name, DEFAULT_PATH_UNZIPPED_DATA_FOLDER)
@@ -0,0 +1,24 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from biokb_wcvp.api.main import app
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory: pytest.TempPathFactory):
+    """Test client shared by the whole session; runs the app lifespan once.
+
+    The lifespan creates its DbManager from CONNECTION_STR, which points to a
+    temporary SQLite file so the tests never touch the default database.
+    """
+    path_to_db = tmp_path_factory.mktemp("db") / "test.db"
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("CONNECTION_STR", f"sqlite:///{path_to_db}")
+        with TestClient(app) as c:
+            yield c
+
+
+@pytest.fixture(scope="session")
+def openapi_doc(client):
+    """OpenAPI document of the app, fetched once per session."""
+    return client.get("/openapi.json").json()
@@ -1,86 +1,123 @@
-from fastapi.testclient import TestClient
-from biokb_wcvp.api.main import app
 import os.path
-from fastapi import status
-import pytest
-
-client = TestClient(app)
 
+import pytest
+from fastapi import status
 
-def create_fresh_db():
-    file_name = "test_data.csv"
-    test_file = os.path.join("tests", "data/test_data", file_name)
-    file = {"file": (file_name, open(test_file, "rb"))}
+TEST_DATA_FILE_NAME = "test_data.csv"
+with open(os.path.join("tests", "data/test_data", TEST_DATA_FILE_NAME), "rb") as f:
+    TEST_DATA_CSV = f.read()
+
+EXPECTED_ENDPOINTS = frozenset(
+    {
+        "/load_db_from_csv/",
+        "/",
+        "/families/",
+        "/family/create/",
+        "/family/{id}",
+        "/genus/",
+        "/genus/create/",
+        "/genus/{id}",
+        "/species/",
+        "/species/create/",
+        "/species/{id}",
+        "/areas/",
+        "/area/create/",
+        "/area/{id}",
+        "/regions/",
+        "/region/create/",
+        "/region/{id}",
+        "/continents/",
+        "/continent/create/",
+        "/continent/{id}",
+        "/geographic_areas/",
+        "/climates/",
+        "/climate/create/",
+        "/climate/{id}",
+        "/life_forms/",
+        "/life_form/create/",
+        "/taxon/create/",
+        "/taxon/{taxon_name}",
+        "/taxons/",
+        "/taxons/by_taxon_rank/",
+        "/taxons/by_taxon_status/",
+        "/plant/create/",
+        "/plant/{plant_name_id}",
+        "/plants/",
+        "/plants/by_family/",
+        "/plants/by_genus/",
+        "/plants/by_species/",
+        "/plants/by_extinction/",
+        "/plants/by_climate/",
+        "/plants/by_lifeform/",
+        "/plants/by_area/",
+        "/plants/by_region/",
+        "/plants/by_continent/",
+    }
+)
+
+EXPECTED_SCHEMAS = frozenset(
+    {
+        "Family",
+        "FamilyCreate",
+        "Taxon",
+        "TaxonCreate",
+        "Area",
+        "AreaCreate",
+        "Plant",
+        "PlantCreate",
+    }
+)
+
+
+EXPECTED_PLANT_CREATE_REQUIRED = (
+    "plant_name_id",
+    "ipni_id",
+    # foreign keys
+    "taxon_name",
+    "taxon_status",
+    "taxon_rank",
+    "family_name",
+    "genus_name",
+    "species_name",
+    "primary_author_name",
+    "first_published",
+    "geographic_area_name",
+    "area_code",
+    "area_name",
+    "region_code",
+    "region_name",
+    "continent_code",
+    "continent_name",
+    "lifeform_description",
+    "climate_description",
+    "infraspecies_name",
+)
+
+EXPECTED_REVIEWED_PROPERTY = {
+    "type": "string",
+    "enum": ["N", "Y"],
+    "title": "Reviewed",
+    "default": "N",
+}
+
+
+def create_fresh_db(client):
+    file = {"file": (TEST_DATA_FILE_NAME, TEST_DATA_CSV, "text/csv")}
     response = client.post("/load_db_from_csv/", files=file)
     return response
 
 
-def get_openapi_doc_dict():
-    return client.get("/openapi.json").json()
-
-
-def test_hello_world():
+def test_hello_world(client):
     response = client.get("/")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"msg": "Hello World"}
 
 
 class TestOpenApi:
-    def test_all_endpoint(self):
-        open_api_doc_dict = get_openapi_doc_dict()
-        set_api_endpoints = set(open_api_doc_dict["paths"].keys())
-        expected_endpoints = {
-            "/load_db_from_csv/",
-            "/",
-            "/families/",
-            "/family/create/",
-            "/family/{id}",
-            "/genus/",
-            "/genus/create/",
-            "/genus/{id}",
-            "/species/",
-            "/species/create/",
-            "/species/{id}",
-            "/areas/",
-            "/area/create/",
-            "/area/{id}",
-            "/regions/",
-            "/region/create/",
-            "/region/{id}",
-            "/continents/",
-            "/continent/create/",
-            "/continent/{id}",
-            "/geographic_areas/",
-            "/climates/",
-            "/climate/create/",
-            "/climate/{id}",
-            "/life_forms/",
-            "/life_form/create/",
-            "/taxon/create/",
-            "/taxon/{taxon_name}",
-            "/taxons/",
-            "/taxons/by_taxon_rank/",
-            "/taxons/by_taxon_status/",
-            "/plant/create/",
-            "/plant/{plant_name_id}",
-            "/plants/",
-            "/plants/by_family/",
-            "/plants/by_genus/",
-            "/plants/by_species/",
-            "/plants/by_extinction/",
-            "/plants/by_climate/",
-            "/plants/by_lifeform/",
-            "/plants/by_area/",
-            "/plants/by_region/",
-            "/plants/by_continent/",
-        }
-        missing_endpoints = expected_endpoints - set_api_endpoints
-        extra_endpoints = set_api_endpoints - expected_endpoints
-
-        print("Missing endpoints:", missing_endpoints)
-        print("Extra endpoints:", extra_endpoints)
-
-        assert expected_endpoints.issubset(set_api_endpoints)
+    def test_all_endpoint(self, openapi_doc):
+        set_api_endpoints = set(openapi_doc["paths"].keys())
+        missing_endpoints = EXPECTED_ENDPOINTS - set_api_endpoints
+        assert not missing_endpoints, f"missing endpoints: {missing_endpoints}"
 
     @pytest.mark.parametrize(
         "endpoint,method,tag",
@@ -95,45 +132,30 @@ class TestOpenApi:
             ("/plants/by_family/", "get", "Plant"),
         ],
     )
-    def test_tags(self, endpoint, method, tag):
-        open_api_doc_dict = get_openapi_doc_dict()
-        assert method in open_api_doc_dict["paths"][endpoint].keys()
-        assert open_api_doc_dict["paths"][endpoint][method]["tags"] == [tag]
-
-    def test_schemas_created(self):
-        open_api_doc_dict = get_openapi_doc_dict()
-        schemas = set(open_api_doc_dict["components"]["schemas"].keys())
-        expected_schemas = {
-            "Family",
-            "FamilyCreate",
-            "Taxon",
-            "TaxonCreate",
-            "Area",
-            "AreaCreate",
-            "Plant",
-            "PlantCreate",
-        }
-        assert expected_schemas.issubset(schemas)
+    def test_tags(self, openapi_doc, endpoint, method, tag):
+        assert method in openapi_doc["paths"][endpoint].keys()
+        assert openapi_doc["paths"][endpoint][method]["tags"] == [tag]
+
+    def test_schemas_created(self, openapi_doc):
+        schemas = set(openapi_doc["components"]["schemas"].keys())
+        assert EXPECTED_SCHEMAS.issubset(schemas)
 
 
 class TestFamily:
 
-    def test_family_schema(self):
-        open_api_doc_dict = get_openapi_doc_dict()
-        schemas = open_api_doc_dict["components"]["schemas"]
+    def test_family_schema(self, openapi_doc):
+        schemas = openapi_doc["components"]["schemas"]
         assert schemas["Family"]["required"] == [
             "id",
             "name",
         ]
 
-    def test_family_create_schema(self):
-        open_api_doc_dict = get_openapi_doc_dict()
-        schemas = open_api_doc_dict["components"]["schemas"]
+    def test_family_create_schema(self, openapi_doc):
+        schemas = openapi_doc["components"]["schemas"]
         assert schemas["FamilyCreate"]["required"] == ["name"]
 
-    def test_plant_schema(self):
-        open_api_doc_dict = get_openapi_doc_dict()
-        schemas = open_api_doc_dict["components"]["schemas"]
+    def test_plant_schema(self, openapi_doc):
+        schemas = openapi_doc["components"]["schemas"]
         assert schemas["Plant"]["required"] == [
             "plant_name_id",
             "reviewed",
@@ -151,62 +173,37 @@ class TestFamily:
             "infraspecies_id",
         ]
 
-    def test_plant_create_schema(self):
-        open_api_doc_dict = get_openapi_doc_dict()
+    def test_plant_create_schema(self, openapi_doc):
         # test for PlantCreate schema
-        schemas = open_api_doc_dict["components"]["schemas"]
-        assert schemas["PlantCreate"]["required"] == [
-            "plant_name_id",
-            "ipni_id",
-            # foreign keys
-            "taxon_name",
-            "taxon_status",
-            "taxon_rank",
-            "family_name",
-            "genus_name",
-            "species_name",
-            "primary_author_name",
-            "first_published",
-            "geographic_area_name",
-            "area_code",
-            "area_name",
-            "region_code",
-            "region_name",
-            "continent_code",
-            "continent_name",
-            "lifeform_description",
-            "climate_description",
-            "infraspecies_name",
-        ]
-        assert schemas["PlantCreate"]["properties"]["reviewed"] == {
-            "type": "string",
-            "enum": ["N", "Y"],
-            "title": "Reviewed",
-            "default": "N",
-        }
+        schemas = openapi_doc["components"]["schemas"]
+        assert (
+            tuple(schemas["PlantCreate"]["required"]) == EXPECTED_PLANT_CREATE_REQUIRED
+        )
+        assert (
+            schemas["PlantCreate"]["properties"]["reviewed"]
+            == EXPECTED_REVIEWED_PROPERTY
+        )
 
-    def test_load_db_from_csv(self):
-        file_name = "test_data.csv"
-        test_file = os.path.join("tests", "data/test_data", file_name)
-        file = {"file": (file_name, open(test_file, "rb"))}
+    def test_load_db_from_csv(self, client):
+        file = {"file": (TEST_DATA_FILE_NAME, TEST_DATA_CSV, "text/csv")}
         response = client.post("/load_db_from_csv/", files=file)
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == {"loaded": True}
 
-    def test_create_family(self):
-        create_fresh_db()
+    def test_create_family(self, client):
+        create_fresh_db(client)
         response = client.post("/family/create/", json={"name": "test_family"})
         assert response.json() == {"id": 11, "name": "test_family"}
 
-    def test_get_families_default(self):
+    def test_get_families_default(self, client):
         response = client.get("/families/")
         assert len(response.json()) == 3
 
-    def test_get_families(self):
+    def test_get_families(self, client):
         response = client.get("/families/?offset=1&limit=2")
         assert len(response.json()) == 2
 
-    def test_get_families_limit_too_high(self):
+    def test_get_families_limit_too_high(self, client):
         response = client.get("/families/?offset=1&limit=11")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         assert (
@@ -214,22 +211,21 @@ class TestFamily:
             == "Input should be less than or equal to 10"
         )
 
-    def test_get_family_by_id(self):
+    def test_get_family_by_id(self, client):
         response = client.get("/family/1")
         assert response.json() == {"id": 1, "name": "Oxalidaceae"}
 
 
 class TestTaxon:
 
-    def test_create_taxon(self):
-        create_fresh_db()
+    def test_create_taxon(self, client):
+        create_fresh_db(client)
         data = {
             "taxon_name": "test_name",
             "taxon_rank": "species",
             "taxon_status": "test",
         }
         response = client.post("/taxon/create/", json=data)
-        print("left\n", response)
         assert response.json() == {
             "id": 12,
             "taxon_name": "test_name",
@@ -237,19 +233,19 @@ class TestTaxon:
             "rank_id": 2,
         }
 
-    def test_get_taxons_by_taxon_status(self):
+    def test_get_taxons_by_taxon_status(self, client):
         response = client.get("/taxons/by_taxon_status/?taxon_status=Accepted")
         assert len(response.json()) == 10
 
-    def test_get_taxons_default(self):
+    def test_get_taxons_default(self, client):
         response = client.get("/taxons/")
         assert len(response.json()) == 3
 
-    def test_get_taxons(self):
+    def test_get_taxons(self, client):
         response = client.get("/taxons/?offset=1&limit=2")
         assert len(response.json()) == 2
 
-    def test_get_taxons_limit_too_high(self):
+    def test_get_taxons_limit_too_high(self, client):
         response = client.get("/taxons/?offset=1&limit=11")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         assert (
@@ -260,8 +256,8 @@ class TestTaxon:
 
 class TestPlant:
 
-    def test_create_plant(self):
-        create_fresh_db()
+    def test_create_plant(self, client):
+        create_fresh_db(client)
         data = {
             "plant_name_id": 1,
             "ipni_id": "1-1",
@@ -286,7 +282,6 @@ class TestPlant:
             "infraspecies_name": "rt",
         }
         response = client.post("/plant/create/", json=data)
-        print("left\n", response)
         assert response.json() == {
             "plant_name_id": 1,
             "reviewed": False,
@@ -304,42 +299,39 @@ class TestPlant:
             "infraspecies_id": 4,
         }
 
-    def test_get_plants_by_family(self):
-        response = client.get("/plants/by_family/?name=Asteraceae")
-        assert len(response.json()) == 1
-
-    def test_get_plants_by_genus(self):
-        response = client.get("/plants/by_genus/?name=Picramnia")
-        assert len(response.json()) == 1
-
-    def test_get_plants_by_species(self):
-        response = client.get("/plants/by_species/?name=dentata")
-        assert len(response.json()) == 1
-
-    def test_get_plants_by_extinction(self):
-        # Test with extinction=False (0)
-        response = client.get("/plants/by_extinction/?extinction=0")
+    @pytest.mark.parametrize(
+        "url,expected_len",
+        [
+            ("/plants/by_family/?name=Asteraceae", 1),
+            ("/plants/by_genus/?name=Picramnia", 1),
+            ("/plants/by_species/?name=dentata", 1),
+            ("/plants/by_climate/?description=wet tropical", 3),
+            ("/plants/by_lifeform/?description=tree", 1),
+            ("/plants/by_continent/?name=EUROPE", 4),
+            ("/plants/by_continent/?name=SOUTHERN AMERICA", 1),
+        ],
+    )
+    def test_get_plants_by(self, client, url, expected_len):
+        response = client.get(url)
         assert response.status_code == 200
         assert isinstance(response.json(), list)  # Ensure response is a list
-        assert len(response.json()) == 11
+        assert len(response.json()) == expected_len
 
-        # Test with extinction=True (1)
-        response = client.get("/plants/by_extinction/?extinction=1")
+    @pytest.mark.parametrize(
+        "extinction,expected_len",
+        [
+            (0, 11),
+            # Expected number of results for extinct taxons
+            (1, 1),
+        ],
+    )
+    def test_get_plants_by_extinction(self, client, extinction, expected_len):
+        response = client.get(f"/plants/by_extinction/?extinction={extinction}")
         assert response.status_code == 200
         assert isinstance(response.json(), list)  # Ensure response is a list
-        assert (
-            len(response.json()) == 1
-        )  # Expected number of results for extinct taxons
-
-    def test_get_plants_by_climate(self):
-        response = client.get("/plants/by_climate/?description=wet tropical")
-        assert len(response.json()) == 3
-
-    def test_get_plants_by_lifeform(self):
-        response = client.get("/plants/by_lifeform/?description=tree")
-        assert len(response.json()) == 1
+        assert len(response.json()) == expected_len
 
-    def test_get_taxons_by_taxon_rank(self):
+    def test_get_taxons_by_taxon_rank(self, client):
 
         response = client.get("/taxons/by_taxon_rank/?taxon_rank=Subspecies")
         assert len(response.json()) == 2
@@ -350,14 +342,8 @@ class TestPlant:
         response = client.get("/taxons/by_taxon_rank/?taxon_rank=Species")
         assert len(response.json()) == 8
 
-    def test_get_plants_by_continent(self):
-        response = client.get("/plants/by_continent/?name=EUROPE")
-        assert len(response.json()) == 4
-        response = client.get("/plants/by_continent/?name=SOUTHERN AMERICA")
-        assert len(response.json()) == 1
-
-    def test_get_plant(self):
-        create_fresh_db()
+    def test_get_plant(self, client):
+        create_fresh_db(client)
         response = client.get("/plant/2393672")
         assert response.json() == {
             "plant_name_id": 2393672,
@@ -376,8 +362,8 @@ class TestPlant:
             "infraspecies_id": 1,
         }
 
-    def test_delete_plant(self):
-        create_fresh_db()
+    def test_delete_plant(self, client):
+        create_fresh_db(client)
         response = client.delete("/plant/2393672")
         assert response.json() is True
         response = client.delete("/plant/2393672")
@@ -1,9 +1,34 @@
 import pandas as pd
 import pytest
+from pandas.io.sql import SQLDatabase, SQLTable
 from sqlalchemy import create_engine
 
 from biokb_wcvp.db import models
-from biokb_wcvp.db.manager import DbManager
+from biokb_wcvp.db.manager import DbManager, _rows_to_csv
+
+EXPECTED_TABLES = frozenset(
+    models.table_prefix + name
+    for name in (
+        "tree",
+        "taxon_rank",
+        "taxon_status",
+        "family",
+        "genus",
+        "infraspecific_rank",
+        "lifeform_description",
+        "climate_description",
+        "plant",
+        "temp_plant",
+        "continent",
+        "region",
+        "area",
+        "location",
+        "taxonomy_name",
+        "geo_location_level_1",
+        "geo_location_level_2",
+        "geo_location_level_3",
+    )
+)
 
 
 @pytest.fixture
@@ -12,7 +37,7 @@ def db_manager() -> DbManager:
     Creates a temporary SQLite database for test
     """
     engine = create_engine(f"sqlite://")  # in memory
-    db_manager = DbManager(engine=engine, path_data_folder="tests/data")
+    db_manager = DbManager(engine=engine)
     return db_manager
 
 
@@ -20,23 +45,23 @@ class TestDbManager:
     def test_create_db(self, db_manager: DbManager):
         db_manager.recreate_db()
         tables = models.Base.metadata.tables.keys()
-        tables_expected: list[str] = [
-            "family",
-            "taxon_rank",
-            "taxon_status",
-            "infraspecies",
-            "lifeform_description",
-            "climate_description",
-            "continent",
-            "region",
-            "area",
-            "publication",
-            "genus",
-            "taxon",
-            "environmental_description",
-            "geographic_area",
-            "species",
-            "plant",
+        assert set(tables) == EXPECTED_TABLES
+
+
+class TestPostgresCopy:
+    def test_rows_to_csv(self):
+        """Rows are formatted the way pandas hands them to a `to_sql` method."""
+        df = pd.DataFrame(
+            {
+                "accepted_plant_name_id": [5, None],
+                "taxon_name": ["Oxalis, sepium", None],
+                "reviewed": [True, False],
+            }
+        )
+        with create_engine("sqlite://").connect() as connection:
+            table = SQLTable("plant", SQLDatabase(connection), frame=df, index=False)
+            _, data = table.insert_data()
+        assert _rows_to_csv(zip(*data)).getvalue().splitlines() == [
+            '5,"Oxalis, sepium",True',
+            ",,False",
         ]
-        tables_expected_with_prefix = {models.Base._prefix + x for x in tables_expected}
-        assert set(tables) == tables_expected_with_prefix
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from biokb_wcvp.db.tree import Tree
+
+
+@pytest.fixture
+def df_tree() -> pd.DataFrame:
+    """
+    Small hierarchy:
+        1
+        ├── 2
+        │   └── 4
+        └── 3
+    """
+    return pd.DataFrame({"id": [2, 3, 4], "parent_id": [1, 1, 2]})
+
+
+class TestTree:
+    def test_get_tree(self, df_tree: pd.DataFrame):
+        tree_df, root_id = Tree(df_tree, "id", "parent_id").get_tree()
+        assert root_id == 1
+        assert tree_df["id"].tolist() == [1, 2, 4, 3]
+        assert tree_df["level"].tolist() == [0, 1, 2, 1]
+        assert tree_df["is_leaf"].tolist() == [False, False, True, True]
+        assert tree_df.loc[2, "right_tree_id"] == 4
+
+    def test_get_tree_cached(self, df_tree: pd.DataFrame):
+        tree = Tree(df_tree, "id", "parent_id")
+        tree_df, _ = tree.get_tree()
+        assert tree.get_tree()[0] is tree_df
+        tree.invalidate()
+        assert tree.get_tree()[0] is not tree_df
+
+    def test_deep_tree(self):
+        depth = 5_000  # deeper than the default recursion limit
+        df = pd.DataFrame({"id": range(2, depth + 2), "parent_id": range(1, depth + 1)})
+        tree_df, root_id = Tree(df, "id", "parent_id").get_tree()
+        assert root_id == 1
+        assert len(tree_df) == depth + 1
+        assert tree_df["level"].max() == depth
+
+    def test_missing_column(self, df_tree: pd.DataFrame):
+        with pytest.raises(ValueError):
+            Tree(df_tree, "id", "unknown")